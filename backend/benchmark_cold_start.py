@@ -0,0 +1,93 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PROBE: str = """
+import json
+import time
+
+start = time.perf_counter()
+
+import main
+
+imported = time.perf_counter()
+client = main.app.test_client()
+
+client.post(
+    "/validate-expression",
+    json={"expression": "beta*S*I", "allowedSymbols": ["beta", "S", "I"]},
+)
+
+validated = time.perf_counter()
+
+client.post(
+    "/simulate",
+    json={
+        "parameters": {"time": 100, "nodesAmount": 100},
+        "model": {
+            "compartments": [
+                {"id": "s", "name": "S", "value": 990},
+                {"id": "i", "name": "I", "value": 10},
+                {"id": "r", "name": "R", "value": 0},
+            ],
+            "constants": [
+                {"id": "b", "name": "beta", "value": 0.0003},
+                {"id": "g", "name": "gamma", "value": 0.1},
+            ],
+            "interventions": [],
+            "flows": [
+                {"id": "f1", "source": "s", "target": "i", "equation": "beta*S*I"},
+                {"id": "f2", "source": "i", "target": "r", "equation": "gamma*I"},
+            ],
+        },
+    },
+)
+
+simulated = time.perf_counter()
+
+print(
+    json.dumps(
+        {
+            "import": imported - start,
+            "validateExpression": validated - start,
+            "simulate": simulated - start,
+        }
+    )
+)
+"""
+
+
+def benchmark_cold_start(runs: int) -> dict[str, list[float]]:
+    timings: dict[str, list[float]] = {}
+
+    for _ in range(runs):
+        output: str = subprocess.run(
+            [sys.executable, "-c", PROBE],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            env={**os.environ, "WORKERS": "0"},
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+
+        for name, timing in json.loads(output.splitlines()[-1]).items():
+            timings.setdefault(name, []).append(timing)
+
+    return timings
+
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Measure backend cold start in fresh interpreters"
+    )
+
+    parser.add_argument("--runs", type=int, default=5)
+
+    for name, timings in benchmark_cold_start(parser.parse_args().runs).items():
+        print(
+            f"{name}: median {statistics.median(timings):.3f} s, "
+            f"min {min(timings):.3f} s, max {max(timings):.3f} s"
+        )
@@ -0,0 +1,11 @@
+from typing import TypedDict
+
+
+class CacheStats(TypedDict):
+    process: int
+    entries: int
+    size: int
+    maxEntries: int
+    maxSize: int
+    hits: int
+    misses: int
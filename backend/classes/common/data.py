@@ -1,6 +1,9 @@
 from typing import TypedDict
 
+import numpy as np
+import numpy.typing as npt
+
 
 class Data(TypedDict):
-    times: list[float]
-    values: list[float]
+    times: list[float] | npt.NDArray[np.float64]
+    values: list[float] | npt.NDArray[np.float64]
@@ -0,0 +1,63 @@
+from bisect import bisect_right
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+from scipy.integrate import OdeSolution
+
+
+class DenseSolution:
+    solution: OdeSolution
+    rows: np.intp | npt.NDArray[np.intp]
+
+    __bounds: list[float] | None
+    __interpolants: list[Any] | None
+    __index: int
+
+    @property
+    def times(self) -> npt.NDArray[np.float64]:
+        return self.solution.ts_sorted
+
+    def __init__(
+        self,
+        solution: OdeSolution,
+        rows: np.intp | npt.NDArray[np.intp],
+    ) -> None:
+        self.solution = solution
+        self.rows = rows
+
+        self.__bounds = None
+        self.__interpolants = None
+        self.__index = 0
+
+    def __call__(self, times: npt.ArrayLike) -> np.float64 | npt.NDArray[np.float64]:
+        return self.solution(np.clip(times, self.solution.t_min, self.solution.t_max))[
+            self.rows
+        ]
+
+    def at(self, time: float) -> np.float64 | npt.NDArray[np.float64]:
+        if self.__bounds is None:
+            self.__prepare()
+
+        bounds: list[float] = self.__bounds
+        index: int = self.__index
+
+        if not bounds[index] <= time <= bounds[index + 1]:
+            index = min(max(bisect_right(bounds, time) - 1, 0), len(bounds) - 2)
+
+            self.__index = index
+
+        return self.__interpolants[index](min(max(time, bounds[0]), bounds[-1]))[
+            self.rows
+        ]
+
+    def select(self, indexes: int | list[int]) -> "DenseSolution":
+        return DenseSolution(self.solution, np.asarray(self.rows)[indexes])
+
+    def __prepare(self) -> None:
+        self.__bounds = self.solution.ts_sorted.tolist()
+        self.__interpolants = (
+            self.solution.interpolants
+            if self.solution.ascending
+            else self.solution.interpolants[::-1]
+        )
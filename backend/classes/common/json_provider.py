@@ -0,0 +1,16 @@
+from typing import Any
+
+import numpy as np
+from flask.json.provider import DefaultJSONProvider
+
+
+class JSONProvider(DefaultJSONProvider):
+    @staticmethod
+    def default(o: Any) -> Any:
+        if isinstance(o, np.ndarray):
+            return o.tolist()
+
+        if isinstance(o, np.generic):
+            return o.item()
+
+        return DefaultJSONProvider.default(o)
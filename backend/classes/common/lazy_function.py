@@ -0,0 +1,20 @@
+import importlib
+from typing import Any, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class LazyFunction(Generic[T]):
+    module: str
+    name: str
+
+    def __init__(self, module: str, name: str) -> None:
+        self.module = module
+        self.name = name
+
+    def __call__(self, *args: Any) -> T:
+        function: Callable[..., T] = getattr(
+            importlib.import_module(self.module), self.name
+        )
+
+        return function(*args)
@@ -0,0 +1,67 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Generic, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    max_entries: int
+    max_size: int
+    size: int
+    hits: int
+    misses: int
+    _entries: OrderedDict[K, tuple[V, int]]
+    _get_size: Callable[[V], int]
+    _lock: Lock
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_size: int,
+        get_size: Callable[[V], int],
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._get_size = get_size
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+
+            return self._entries[key][0]
+
+    def set(self, key: K, value: V) -> None:
+        size: int = self._get_size(value)
+
+        with self._lock:
+            if key in self._entries:
+                self.size -= self._entries.pop(key)[1]
+
+            self._entries[key] = (value, size)
+            self.size += size
+
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self.size > self.max_size
+            ):
+                self.size -= self._entries.popitem(last=False)[1][1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
@@ -0,0 +1,11 @@
+from typing import TypedDict
+
+from classes.common.cache_stats import CacheStats
+
+
+class PoolCacheStats(TypedDict):
+    entries: int
+    size: int
+    hits: int
+    misses: int
+    workers: list[CacheStats]
@@ -0,0 +1,117 @@
+from typing import Iterator
+
+import numpy as np
+import numpy.typing as npt
+
+from classes.common.data import Data
+from classes.common.dense_solution import DenseSolution
+from classes.common.interpolation_type import InterpolationType
+from classes.common.values import Values
+from functions.get_lttb_indexes import get_lttb_indexes
+
+
+class SeriesTable:
+    times: npt.NDArray[np.float64]
+    values: npt.NDArray[np.float64]
+    names: list[str]
+    indexes: dict[str, int]
+    interpolation_type: InterpolationType
+    solution: DenseSolution | None
+
+    @property
+    def breakpoints(self) -> npt.NDArray[np.float64]:
+        return self.solution.times if self.solution is not None else self.times
+
+    @property
+    def data(self) -> dict[str, Data]:
+        return self.get_data()
+
+    def get_data(self, max_points: int | None = None) -> dict[str, Data]:
+        if max_points is not None and max_points < self.times.size:
+            indexes: npt.NDArray[np.intp] = get_lttb_indexes(
+                self.times, self.values, max_points
+            )
+            times: npt.NDArray[np.float64] = self.times[indexes]
+            values: npt.NDArray[np.float64] = np.take_along_axis(
+                self.values, indexes, axis=1
+            )
+
+            return {
+                name: {
+                    "times": times[i],
+                    "values": values[i],
+                }
+                for i, name in enumerate(self.names)
+            }
+
+        return {
+            name: {
+                "times": self.times,
+                "values": self.values[i],
+            }
+            for i, name in enumerate(self.names)
+        }
+
+    def __init__(
+        self,
+        times: npt.NDArray[np.float64],
+        values: npt.NDArray[np.float64],
+        names: list[str],
+        interpolation_type: InterpolationType = InterpolationType.PIECEWISE_LINEAR,
+        solution: DenseSolution | None = None,
+    ) -> None:
+        self.times = np.asarray(times, dtype=np.float64)
+        self.values = np.asarray(values, dtype=np.float64).reshape(
+            len(names), self.times.size
+        )
+        self.names = list(names)
+        self.indexes = {name: i for i, name in enumerate(self.names)}
+        self.interpolation_type = InterpolationType(interpolation_type)
+        self.solution = solution
+
+    def __getitem__(self, key: str) -> Values:
+        return Values(
+            self.times,
+            self.values[self.indexes[key]],
+            self.interpolation_type,
+            (
+                self.solution.select(self.indexes[key])
+                if self.solution is not None
+                else None
+            ),
+        )
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.indexes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def select(self, names: list[str]) -> Values:
+        indexes: list[int] = [self.indexes[name] for name in names]
+
+        return Values(
+            self.times,
+            self.values[indexes].T,
+            self.interpolation_type,
+            self.solution.select(indexes) if self.solution is not None else None,
+        )
+
+    def resample(self, times: npt.NDArray[np.float64]) -> "SeriesTable":
+        if self.solution is None and np.array_equal(self.times, times):
+            return self
+
+        return SeriesTable(
+            times,
+            (
+                self.solution(times)
+                if self.solution is not None
+                else [self[name](times) for name in self.names]
+            ),
+            self.names,
+            self.interpolation_type,
+            self.solution,
+        )
@@ -0,0 +1,9 @@
+from typing import TypedDict
+
+import numpy as np
+import numpy.typing as npt
+
+
+class SharedData(TypedDict):
+    times: npt.NDArray[np.float64]
+    values: dict[str, list[float] | npt.NDArray[np.float64]]
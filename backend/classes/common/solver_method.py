@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class SolverMethod(str, Enum):
+    LSODA = "LSODA"
+    BDF = "BDF"
+    RADAU = "Radau"
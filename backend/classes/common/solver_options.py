@@ -0,0 +1,8 @@
+from typing import NotRequired, TypedDict
+
+
+class SolverOptions(TypedDict):
+    adaptive: NotRequired[bool]
+    rtol: NotRequired[float]
+    atol: NotRequired[float]
+    maxStep: NotRequired[float]
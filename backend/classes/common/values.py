@@ -1,6 +1,10 @@
+from bisect import bisect_right
+
 import numpy as np
 import numpy.typing as npt
+from scipy.sparse import csr_matrix
 
+from classes.common.dense_solution import DenseSolution
 from classes.common.interpolation_type import InterpolationType
 
 
@@ -8,21 +12,38 @@ class Values:
     times: npt.NDArray[np.float64]
     values: npt.NDArray[np.float64]
     interpolation_type: InterpolationType
+    solution: DenseSolution | None
+
+    __bounds: list[float] | None
+    __slopes: npt.NDArray[np.float64] | None
+    __index: int
 
     def __init__(
         self,
         times: npt.NDArray[np.float64],
         values: npt.NDArray[np.float64],
         interpolation_type: InterpolationType = InterpolationType.PIECEWISE_LINEAR,
+        solution: DenseSolution | None = None,
     ) -> None:
         self.times = times
         self.values = values
         self.interpolation_type = InterpolationType(interpolation_type)
+        self.solution = solution
+
+        self.__bounds = None
+        self.__slopes = None
+        self.__index = 0
 
     def __call__(self, times: npt.ArrayLike) -> np.float64 | npt.NDArray[np.float64]:
         if self.values.size == 0:
             raise ValueError("There are no values")
 
+        if self.solution is not None:
+            return self.solution(times)
+
+        if np.ndim(times) == 0:
+            return self.at(times)
+
         times = np.asarray(times, dtype=np.float64)
         indexes: npt.NDArray[np.intp] = np.searchsorted(self.times, times, "right")
 
@@ -56,3 +77,83 @@ class Values:
                 raise ValueError("Interpolation type not supported")
 
         return np.float64(out.item()) if out.shape == () else out
+
+    def get_weights(self, times: npt.ArrayLike) -> csr_matrix:
+        times = np.atleast_1d(np.asarray(times, dtype=np.float64))
+        size: int = self.times.size
+        indexes: npt.NDArray[np.intp] = np.searchsorted(self.times, times, "right")
+
+        mask_after: npt.NDArray[np.bool] = indexes >= size - 1
+        mask_inside: npt.NDArray[np.bool] = ~((indexes == 0) | mask_after)
+
+        left: npt.NDArray[np.intp] = np.where(
+            mask_after, size - 1, np.maximum(indexes - 1, 0)
+        )
+        right: npt.NDArray[np.intp] = np.minimum(left + 1, size - 1)
+        right_weights: npt.NDArray[np.float64] = np.zeros(times.size, dtype=np.float64)
+
+        if self.interpolation_type is InterpolationType.PIECEWISE_LINEAR:
+            right_weights[mask_inside] = (
+                times[mask_inside] - self.times[left[mask_inside]]
+            ) / (self.times[right[mask_inside]] - self.times[left[mask_inside]])
+
+        elif self.interpolation_type is not InterpolationType.PIECEWISE_CONSTANT:
+            raise ValueError("Interpolation type not supported")
+
+        rows: npt.NDArray[np.intp] = np.arange(times.size)
+
+        return csr_matrix(
+            (
+                np.concatenate([1 - right_weights, right_weights]),
+                (np.concatenate([rows, rows]), np.concatenate([left, right])),
+            ),
+            shape=(times.size, size),
+        )
+
+    def at(self, time: float) -> np.float64 | npt.NDArray[np.float64]:
+        if self.solution is not None:
+            return self.solution.at(time)
+
+        if self.__bounds is None:
+            self.__prepare()
+
+        bounds: list[float] = self.__bounds
+        index: int = self.__index
+
+        if not bounds[index] <= time < bounds[index + 1]:
+            if bounds[index + 1] <= time < bounds[index + 2]:
+                index += 1
+
+            elif index > 0 and bounds[index - 1] <= time < bounds[index]:
+                index -= 1
+
+            else:
+                index = bisect_right(bounds, time) - 1
+
+            self.__index = index
+
+        if index == 0:
+            return self.values[0]
+
+        if index >= len(bounds) - 3:
+            return self.values[-1]
+
+        if self.interpolation_type is InterpolationType.PIECEWISE_CONSTANT:
+            return self.values[index - 1]
+
+        return self.values[index - 1] + self.__slopes[index - 1] * (
+            time - bounds[index]
+        )
+
+    def __prepare(self) -> None:
+        if self.values.size == 0:
+            raise ValueError("There are no values")
+
+        if self.interpolation_type is InterpolationType.PIECEWISE_LINEAR:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                self.__slopes = (np.diff(self.values, axis=0).T / np.diff(self.times)).T
+
+        elif self.interpolation_type is not InterpolationType.PIECEWISE_CONSTANT:
+            raise ValueError("Interpolation type not supported")
+
+        self.__bounds = [-np.inf, *self.times.tolist(), np.inf]
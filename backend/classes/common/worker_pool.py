@@ -0,0 +1,320 @@
+import os
+import signal
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
+from functools import partial
+from multiprocessing import get_context
+from multiprocessing.context import ForkServerContext
+from multiprocessing.managers import DictProxy, SyncManager
+from multiprocessing.pool import Pool
+from threading import BoundedSemaphore, Event, Lock, Thread
+from typing import Any, Callable, TypeVar
+from uuid import uuid4
+
+T = TypeVar("T")
+
+MONITOR_INTERVAL: float = 1
+
+running_tasks: DictProxy | None = None
+worker_reports: DictProxy | None = None
+worker_reporter: Callable[[], Any] | None = None
+
+
+def initialize_worker(
+    running: DictProxy,
+    reports: DictProxy,
+    initializer: Callable[[], None] | None,
+    reporter: Callable[[], Any] | None,
+) -> None:
+    global running_tasks, worker_reports, worker_reporter
+
+    running_tasks = running
+    worker_reports = reports
+    worker_reporter = reporter
+
+    if initializer is not None:
+        initializer()
+
+    report_worker()
+
+
+def report_worker() -> None:
+    if worker_reports is not None and worker_reporter is not None:
+        worker_reports[os.getpid()] = worker_reporter()
+
+
+def run_task(task_id: str, function: Callable[..., T], args: tuple[Any, ...]) -> T:
+    if running_tasks is None:
+        return function(*args)
+
+    pid: int = os.getpid()
+
+    if running_tasks.setdefault(task_id, pid) != pid:
+        running_tasks.pop(task_id, None)
+
+        raise RuntimeError("Job was cancelled")
+
+    try:
+        return function(*args)
+
+    finally:
+        running_tasks.pop(task_id, None)
+
+        report_worker()
+
+
+def is_process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+
+        return True
+
+    except ProcessLookupError:
+        return False
+
+
+class WorkerPool:
+    workers: int
+    queue_limit: int
+    timeout: float | None
+    _initializer: Callable[[], None] | None
+    _reporter: Callable[[], Any] | None
+    _preload: list[str]
+    _pool: Pool | None
+    _executor: ThreadPoolExecutor | None
+    _manager: SyncManager | None
+    _running: DictProxy | None
+    _reports: DictProxy | None
+    _futures: dict[str, Future]
+    _stopped: Event
+    _slots: BoundedSemaphore
+    _lock: Lock
+
+    def __init__(
+        self,
+        workers: int,
+        queue_limit: int,
+        timeout: float | None = None,
+        initializer: Callable[[], None] | None = None,
+        reporter: Callable[[], Any] | None = None,
+        preload: list[str] | None = None,
+    ) -> None:
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.timeout = timeout
+        self._initializer = initializer
+        self._reporter = reporter
+        self._preload = preload or []
+        self._pool = None
+        self._executor = None
+        self._manager = None
+        self._running = None
+        self._reports = None
+        self._futures = {}
+        self._stopped = Event()
+        self._slots = BoundedSemaphore(max(workers, 1) + queue_limit)
+        self._lock = Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self.workers <= 0:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=max(self.workers, 1) + self.queue_limit
+                    )
+
+                return
+
+            if self._pool is not None:
+                return
+
+            context: ForkServerContext = get_context("forkserver")
+
+            context.set_forkserver_preload(self._preload)
+
+            self._manager = context.Manager()
+            self._running = self._manager.dict()
+            self._reports = self._manager.dict()
+            self._pool = context.Pool(
+                self.workers,
+                initialize_worker,
+                (self._running, self._reports, self._initializer, self._reporter),
+            )
+            self._stopped.clear()
+
+            Thread(target=self.__monitor, daemon=True).start()
+
+    def warm_up(self) -> None:
+        self.start()
+
+        if self.workers <= 0 and self._initializer is not None:
+            self._initializer()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+            if self._pool is not None:
+                self._stopped.set()
+                self._pool.terminate()
+                self._pool = None
+
+            if self._manager is not None:
+                self._manager.shutdown()
+                self._manager = None
+                self._running = None
+                self._reports = None
+
+            task_ids: list[str] = list(self._futures)
+
+        for task_id in task_ids:
+            self.__set_exception(task_id, RuntimeError("Worker pool was shut down"))
+
+    def submit(
+        self, function: Callable[..., T], *args: Any, wait: float | None = 0
+    ) -> "Future[T]":
+        if not (
+            self._slots.acquire(timeout=wait)
+            if wait != 0
+            else self._slots.acquire(blocking=False)
+        ):
+            raise RuntimeError("Server is busy. Please try again later")
+
+        future: Future[T]
+
+        try:
+            self.start()
+
+            with self._lock:
+                if self._executor is not None:
+                    future = self._executor.submit(function, *args)
+
+                else:
+                    task_id: str = uuid4().hex
+
+                    future = Future()
+                    future.set_running_or_notify_cancel()
+
+                    self._futures[task_id] = future
+
+                    self._pool.apply_async(  # type: ignore
+                        run_task,
+                        (task_id, function, args),
+                        callback=partial(self.__set_result, task_id),
+                        error_callback=partial(self.__set_exception, task_id),
+                    )
+
+        except BaseException:
+            self._slots.release()
+
+            raise
+
+        future.add_done_callback(lambda _: self._slots.release())
+
+        return future
+
+    def result(self, future: "Future[T]", timeout: float | None) -> T:
+        try:
+            return future.result(timeout=timeout)
+
+        except TimeoutError:
+            self.terminate(
+                future, RuntimeError(f"Job did not finish in {timeout} seconds")
+            )
+
+            raise RuntimeError(f"Job did not finish in {timeout} seconds")
+
+    def get_reports(self) -> list[Any]:
+        if self._reporter is None:
+            return []
+
+        if self.workers <= 0:
+            return [self._reporter()]
+
+        self.start()
+
+        with self._lock:
+            reports: DictProxy | None = self._reports
+
+        if reports is None:
+            return []
+
+        alive_reports: list[Any] = []
+
+        for pid, report in sorted(reports.items()):
+            if is_process_alive(pid):
+                alive_reports.append(report)
+
+            else:
+                reports.pop(pid, None)
+
+        return alive_reports
+
+    def run(self, function: Callable[..., T], *args: Any) -> T:
+        return self.result(self.submit(function, *args), self.timeout)
+
+    def terminate(self, future: Future, error: BaseException) -> None:
+        if future.cancel():
+            return
+
+        with self._lock:
+            running: DictProxy | None = self._running
+            task_id: str | None = next(
+                (
+                    task_id
+                    for task_id, task_future in self._futures.items()
+                    if task_future is future
+                ),
+                None,
+            )
+
+        if running is None or task_id is None:
+            return
+
+        pid: int = running.setdefault(task_id, 0)
+
+        self.__set_exception(task_id, error)
+
+        if pid and running.get(task_id) == pid:
+            try:
+                os.kill(pid, signal.SIGTERM)
+
+            except ProcessLookupError:
+                pass
+
+    def __set_result(self, task_id: str, result: Any) -> None:
+        with self._lock:
+            future: Future | None = self._futures.pop(task_id, None)
+
+        if future is not None:
+            future.set_result(result)
+
+    def __set_exception(self, task_id: str, error: BaseException) -> None:
+        with self._lock:
+            future: Future | None = self._futures.pop(task_id, None)
+
+        if future is not None:
+            future.set_exception(error)
+
+    def __monitor(self) -> None:
+        while not self._stopped.wait(MONITOR_INTERVAL):
+            with self._lock:
+                running: DictProxy | None = self._running
+
+            if running is None:
+                return
+
+            try:
+                tasks: list[tuple[str, int]] = list(running.items())
+
+            except (OSError, EOFError):
+                return
+
+            for task_id, pid in tasks:
+                if pid and not is_process_alive(pid):
+                    running.pop(task_id, None)
+
+                    self.__set_exception(
+                        task_id, RuntimeError("Worker process terminated unexpectedly")
+                    )
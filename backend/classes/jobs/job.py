@@ -0,0 +1,16 @@
+from typing import Any, TypedDict
+
+from classes.jobs.job_progress import JobProgress
+from classes.jobs.job_status import JobStatus
+from classes.jobs.job_type import JobType
+
+
+class Job(TypedDict):
+    id: str
+    type: JobType
+    status: JobStatus
+    progress: JobProgress | None
+    result: Any | None
+    error: str | None
+    createdAt: float
+    finishedAt: float | None
@@ -0,0 +1,6 @@
+from typing import TypedDict
+
+
+class JobProgress(TypedDict):
+    iteration: int
+    maxIterations: int
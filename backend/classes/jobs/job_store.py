@@ -0,0 +1,163 @@
+from concurrent.futures import Future
+from functools import partial
+from multiprocessing import Manager
+from multiprocessing.managers import DictProxy, SyncManager
+from threading import Lock
+from time import time
+from typing import Any
+from uuid import uuid4
+
+from classes.jobs.job import Job
+from classes.jobs.job_status import JobStatus
+from classes.jobs.job_type import JobType
+
+FINISHED_STATUSES: tuple[JobStatus, ...] = (
+    JobStatus.COMPLETED,
+    JobStatus.FAILED,
+    JobStatus.CANCELLED,
+)
+
+
+class JobStore:
+    max_jobs: int
+    ttl: float
+    progress: DictProxy
+    cancellations: DictProxy
+    _jobs: dict[str, Job]
+    _futures: dict[str, Future]
+    _manager: SyncManager
+    _lock: Lock
+
+    def __init__(self, max_jobs: int, ttl: float) -> None:
+        self.max_jobs = max_jobs
+        self.ttl = ttl
+        self._jobs = {}
+        self._futures = {}
+        self._manager = Manager()
+        self._lock = Lock()
+
+        self.progress = self._manager.dict()
+        self.cancellations = self._manager.dict()
+
+    def create(self, job_type: JobType) -> Job:
+        job: Job = {
+            "id": uuid4().hex,
+            "type": job_type,
+            "status": JobStatus.PENDING,
+            "progress": None,
+            "result": None,
+            "error": None,
+            "createdAt": time(),
+            "finishedAt": None,
+        }
+
+        with self._lock:
+            self.__evict()
+
+            self._jobs[job["id"]] = job
+
+        return {**job}
+
+    def attach(self, job_id: str, future: Future) -> None:
+        with self._lock:
+            self._futures[job_id] = future
+
+        future.add_done_callback(partial(self.__finish, job_id))
+
+    def remove(self, job_id: str) -> None:
+        with self._lock:
+            self._jobs.pop(job_id, None)
+            self._futures.pop(job_id, None)
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            job: Job | None = self._jobs.get(job_id)
+
+            if job is None:
+                return None
+
+            if job["status"] not in FINISHED_STATUSES:
+                future: Future | None = self._futures.get(job_id)
+
+                if future is not None and future.running():
+                    job["status"] = JobStatus.RUNNING
+
+                job["progress"] = self.progress.get(job_id, job["progress"])
+
+            return {**job}
+
+    def cancel(self, job_id: str) -> Job | None:
+        with self._lock:
+            job: Job | None = self._jobs.get(job_id)
+
+            if job is None:
+                return None
+
+            if job["status"] not in FINISHED_STATUSES:
+                self.cancellations[job_id] = True
+
+                future: Future | None = self._futures.get(job_id)
+
+                if future is not None:
+                    future.cancel()
+
+                job["status"] = JobStatus.CANCELLED
+                job["finishedAt"] = time()
+
+            return {**job}
+
+    def __finish(self, job_id: str, future: Future) -> None:
+        with self._lock:
+            job: Job | None = self._jobs.get(job_id)
+
+            self._futures.pop(job_id, None)
+
+            if job is not None:
+                job["progress"] = self.progress.get(job_id, job["progress"])
+
+            self.progress.pop(job_id, None)
+            self.cancellations.pop(job_id, None)
+
+            if job is None or job["status"] in FINISHED_STATUSES:
+                return
+
+            job["finishedAt"] = time()
+
+            if future.cancelled():
+                job["status"] = JobStatus.CANCELLED
+
+                return
+
+            error: BaseException | None = future.exception()
+
+            if error is not None:
+                job["status"] = JobStatus.FAILED
+                job["error"] = str(error)
+
+                return
+
+            result: Any = future.result()
+
+            if isinstance(result, dict) and "error" in result:
+                job["status"] = JobStatus.FAILED
+                job["error"] = result["error"]
+
+                return
+
+            job["status"] = JobStatus.COMPLETED
+            job["result"] = result
+
+    def __evict(self) -> None:
+        finished_jobs: list[Job] = sorted(
+            (job for job in self._jobs.values() if job["status"] in FINISHED_STATUSES),
+            key=lambda job: job["finishedAt"] or 0,
+        )
+
+        for job in finished_jobs:
+            if (
+                len(self._jobs) <= self.max_jobs
+                and time() - (job["finishedAt"] or 0) <= self.ttl
+            ):
+                break
+
+            del self._jobs[job["id"]]
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class JobType(str, Enum):
+    SIMULATION = "simulation"
+    BATCH_SIMULATION = "batch-simulation"
+    OPTIMAL_CONTROL = "optimal-control"
+    PARAMETERS_IDENTIFICATION = "parameters-identification"
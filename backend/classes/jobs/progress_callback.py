@@ -0,0 +1,3 @@
+from typing import Callable
+
+ProgressCallback = Callable[[int, int], None]
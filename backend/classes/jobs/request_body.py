@@ -0,0 +1,8 @@
+from typing import Any, TypedDict
+
+from classes.model.model import Model
+
+
+class JobRequestBody(TypedDict):
+    parameters: Any
+    model: Model
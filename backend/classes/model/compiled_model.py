@@ -0,0 +1,178 @@
+import numpy as np
+import numpy.typing as npt
+import sympy as sp
+from scipy.sparse import csc_matrix
+from typing import Any, Callable
+
+from classes.model.equation import Equation
+from functions.code_cache import get_code_key, get_function_source, load_code, save_code
+
+
+class CompiledModel:
+    names: list[str]
+    variables: list[str]
+    indexes: dict[str, int]
+    jacobian_sparsity: csc_matrix
+    _function: Callable
+    _jacobian_function: Callable
+    _jacobian_entries_function: Callable
+
+    def __init__(self, equations: dict[str, Equation]) -> None:
+        self.names = list(equations.keys())
+        self.indexes = {name: i for i, name in enumerate(self.names)}
+
+        key: str = get_code_key(
+            "compiled-model",
+            *self.names,
+            *[sp.srepr(equation.expression) for equation in equations.values()],
+        )
+        code: dict[str, Any] = load_code(
+            key,
+            ["function", "jacobian_function", "jacobian_entries_function"],
+            ["variables", "jacobian_rows", "jacobian_columns"],
+        ) or self.__compile(key, equations)
+        rows: npt.NDArray[np.intp] = np.array(code["jacobian_rows"], dtype=np.intp)
+        columns: npt.NDArray[np.intp] = np.array(
+            code["jacobian_columns"], dtype=np.intp
+        )
+
+        self.variables = code["variables"]
+        self.jacobian_sparsity = csc_matrix(
+            (
+                np.ones(rows.size, dtype=np.int8),
+                rows,
+                np.searchsorted(columns, np.arange(len(self.names) + 1)),
+            ),
+            shape=(len(self.names), len(self.names)),
+        )
+        self._function = code["function"]
+        self._jacobian_function = code["jacobian_function"]
+        self._jacobian_entries_function = code["jacobian_entries_function"]
+
+    def __compile(self, key: str, equations: dict[str, Equation]) -> dict[str, Any]:
+        variables: list[str] = sorted(
+            {
+                variable.name
+                for equation in equations.values()
+                for variable in equation.variables
+            }
+            - set(self.names)
+        )
+
+        state_symbols: list[sp.Symbol] = [sp.Symbol(name) for name in self.names]
+        arguments: list[list[sp.Symbol]] = [
+            state_symbols,
+            [sp.Symbol(variable) for variable in variables],
+        ]
+        expressions: list[sp.Expr] = [
+            sp.sympify(equation.expression) for equation in equations.values()
+        ]
+        jacobian: sp.Matrix = sp.Matrix(expressions).jacobian(state_symbols)
+
+        entries: list[tuple[int, int]] = sorted(
+            jacobian.todok().keys(), key=lambda entry: (entry[1], entry[0])
+        )
+        code: dict[str, Any] = {
+            "variables": variables,
+            "jacobian_rows": [row for row, _ in entries],
+            "jacobian_columns": [column for _, column in entries],
+            "function": sp.lambdify(arguments, expressions, modules="numpy"),
+            "jacobian_function": sp.lambdify(arguments, jacobian, modules="numpy"),
+            "jacobian_entries_function": sp.lambdify(
+                arguments,
+                [jacobian[row, column] for row, column in entries],
+                modules="numpy",
+            ),
+        }
+        sources: list[str | None] = [
+            get_function_source(code[name], name)
+            for name in ("function", "jacobian_function", "jacobian_entries_function")
+        ]
+
+        if all(source is not None for source in sources):
+            save_code(
+                key,
+                "".join(
+                    [
+                        *[
+                            f"{name} = {code[name]!r}\n"
+                            for name in (
+                                "variables",
+                                "jacobian_rows",
+                                "jacobian_columns",
+                            )
+                        ],
+                        *[f"\n\n{source}" for source in sources],
+                    ]
+                ),
+            )
+
+        return code
+
+    @property
+    def size(self) -> int:
+        return sum(
+            len(function.__code__.co_code)
+            + sum(len(str(constant)) for constant in function.__code__.co_consts)
+            for function in (
+                self._function,
+                self._jacobian_function,
+                self._jacobian_entries_function,
+            )
+        )
+
+    def calculate(
+        self,
+        y: npt.NDArray[np.float64],
+        variables: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        return np.asarray(self._function(y, variables), dtype=np.float64)
+
+    def calculate_jacobian(
+        self,
+        y: npt.NDArray[np.float64],
+        variables: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        return np.asarray(self._jacobian_function(y, variables), dtype=np.float64)
+
+    def calculate_sparse_jacobian(
+        self,
+        y: npt.NDArray[np.float64],
+        variables: npt.NDArray[np.float64],
+    ) -> csc_matrix:
+        return csc_matrix(
+            (
+                np.asarray(
+                    self._jacobian_entries_function(y, variables), dtype=np.float64
+                ),
+                self.jacobian_sparsity.indices,
+                self.jacobian_sparsity.indptr,
+            ),
+            shape=self.jacobian_sparsity.shape,
+        )
+
+    def calculate_batch(
+        self,
+        y: npt.NDArray[np.float64],
+        variables: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        return np.array(
+            [
+                np.broadcast_to(value, y.shape[1:])
+                for value in self._function(y, variables)
+            ],
+            dtype=np.float64,
+        ).reshape(y.shape)
+
+    def calculate_batch_jacobian_entries(
+        self,
+        y: npt.NDArray[np.float64],
+        variables: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        return np.array(
+            [
+                np.broadcast_to(value, y.shape[1:])
+                for value in self._jacobian_entries_function(y, variables)
+            ],
+            dtype=np.float64,
+        ).reshape((self.jacobian_sparsity.nnz, *y.shape[1:]))
@@ -1,94 +1,132 @@
+import numpy as np
+import numpy.typing as npt
+
 from classes.common.data import Data
+from classes.common.interpolation_type import InterpolationType
+from classes.common.series_table import SeriesTable
 from classes.common.values import Values
+from classes.model.variables_evaluator import VariablesEvaluator
 
 
 class Datatable:
-    compartments: dict[str, Values]
-    constants: dict[str, Values]
-    interventions: dict[str, Values]
-    lambdas: dict[str, Values]
+    compartments: SeriesTable
+    constants: dict[str, np.float64]
+    interventions: SeriesTable
+    lambdas: SeriesTable
+
+    __tables: dict[str, SeriesTable]
 
     @property
     def compartments_data(self) -> dict[str, Data]:
-        return {
-            name: {
-                "times": data.times.tolist(),
-                "values": data.values.tolist(),
-            }
-            for name, data in self.compartments.items()
-        }
+        return self.compartments.data
 
     @property
     def constants_data(self) -> dict[str, Data]:
         return {
             name: {
-                "times": data.times.tolist(),
-                "values": data.values.tolist(),
+                "times": [0],
+                "values": [value.item()],
             }
-            for name, data in self.constants.items()
+            for name, value in self.constants.items()
         }
 
     @property
     def interventions_data(self) -> dict[str, Data]:
-        return {
-            name: {
-                "times": data.times.tolist(),
-                "values": data.values.tolist(),
-            }
-            for name, data in self.interventions.items()
-        }
+        return self.interventions.data
 
     @property
     def lambdas_data(self) -> dict[str, Data]:
-        return {
-            name: {
-                "times": data.times.tolist(),
-                "values": data.values.tolist(),
-            }
-            for name, data in self.lambdas.items()
-        }
+        return self.lambdas.data
 
     def __init__(self) -> None:
-        self.compartments = {}
+        self.compartments = SeriesTable(np.zeros(0), np.zeros((0, 0)), [])
         self.constants = {}
-        self.interventions = {}
-        self.lambdas = {}
+        self.interventions = SeriesTable(np.zeros(0), np.zeros((0, 0)), [])
+        self.lambdas = SeriesTable(np.zeros(0), np.zeros((0, 0)), [])
 
-    def __getitem__(self, key: str) -> Values:
-        if key in self.compartments:
-            return self.compartments[key]
+        self.__tables = {}
 
+    def __getitem__(self, key: str) -> Values:
         if key in self.constants:
-            return self.constants[key]
+            return Values(
+                np.zeros(1, dtype=np.float64),
+                np.array([self.constants[key]], dtype=np.float64),
+                InterpolationType.PIECEWISE_CONSTANT,
+            )
 
-        if key in self.interventions:
-            return self.interventions[key]
-
-        if key in self.lambdas:
-            return self.lambdas[key]
+        if key in self.__tables:
+            return self.__tables[key][key]
 
         raise KeyError(f'Key "{key}" not found in Datatable')
 
-    def set_compartments(self, compartments: dict[str, Values]) -> None:
+    def set_compartments(self, compartments: SeriesTable) -> None:
         self.compartments = compartments
 
-    def update_compartments(self, compartments: dict[str, Values]) -> None:
-        self.compartments.update(compartments)
+        self.__index_tables()
 
-    def set_constants(self, constants: dict[str, Values]) -> None:
-        self.constants = constants
+    def set_constants(self, constants: dict[str, float]) -> None:
+        self.constants = {name: np.float64(value) for name, value in constants.items()}
 
-    def update_constants(self, constants: dict[str, Values]) -> None:
-        self.constants.update(constants)
+    def update_constants(self, constants: dict[str, float]) -> None:
+        self.constants.update(
+            {name: np.float64(value) for name, value in constants.items()}
+        )
 
-    def set_interventions(self, interventions: dict[str, Values]) -> None:
+    def set_interventions(self, interventions: SeriesTable) -> None:
         self.interventions = interventions
 
-    def update_interventions(self, interventions: dict[str, Values]) -> None:
-        self.interventions.update(interventions)
+        self.__index_tables()
 
-    def set_lambdas(self, lambdas: dict[str, Values]) -> None:
+    def set_lambdas(self, lambdas: SeriesTable) -> None:
         self.lambdas = lambdas
 
-    def update_lambdas(self, lambdas: dict[str, Values]) -> None:
-        self.lambdas.update(lambdas)
+        self.__index_tables()
+
+    def get_breakpoints(self, names: list[str]) -> npt.NDArray[np.float64]:
+        return np.unique(
+            np.concatenate(
+                [
+                    np.zeros(0, dtype=np.float64),
+                    *{
+                        id(self.__tables[name]): self.__tables[name].breakpoints
+                        for name in names
+                        if name in self.__tables
+                    }.values(),
+                ]
+            )
+        )
+
+    def get_variables_evaluator(self, names: list[str]) -> VariablesEvaluator:
+        values: npt.NDArray[np.float64] = np.zeros(len(names), dtype=np.float64)
+        grouped_names: dict[int, tuple[SeriesTable, list[int], list[str]]] = {}
+
+        for i, name in enumerate(names):
+            if name in self.constants:
+                values[i] = self.constants[name]
+
+            elif name in self.__tables:
+                table: SeriesTable = self.__tables[name]
+                _, indexes, table_names = grouped_names.setdefault(
+                    id(table), (table, [], [])
+                )
+
+                indexes.append(i)
+                table_names.append(name)
+
+            else:
+                raise KeyError(f'Key "{name}" not found in Datatable')
+
+        return VariablesEvaluator(
+            values,
+            [
+                (np.array(indexes, dtype=np.intp), table.select(table_names))
+                for table, indexes, table_names in grouped_names.values()
+            ],
+        )
+
+    def __index_tables(self) -> None:
+        self.__tables = {
+            name: table
+            for table in (self.lambdas, self.interventions, self.compartments)
+            for name in table
+        }
@@ -1,24 +1,43 @@
 import numpy as np
 import numpy.typing as npt
 import sympy as sp
-from sympy.calculus.util import continuous_domain
 from typing import Any, Callable, cast
 
 from classes.model.datatable import Datatable
 from classes.model.continuity_type import ContinuityType
+from functions.code_cache import get_code_key, get_function_source, load_code, save_code
+from functions.get_quadrature import get_quadrature
+from functions.is_continuous import is_continuous
 
 
 class Equation:
-    variables: list[sp.Symbol]
     expression: sp.Expr
-    _function: Callable
+    cse: bool
+    _function: Callable | None
 
-    def __init__(self) -> None:
-        self.variables = []
+    __variables: list[sp.Symbol] | None
+
+    @property
+    def variables(self) -> list[sp.Symbol]:
+        if self.__variables is None:
+            self.__variables = sorted(
+                cast(set[sp.Symbol], sp.sympify(self.expression).free_symbols),
+                key=lambda variable: variable.name,
+            )
+
+        return self.__variables
+
+    def __init__(self, cse: bool = False) -> None:
         self.expression = cast(sp.Expr, 0)
-        self._function = lambda *args: np.float64(0)
+        self.cse = cse
+        self._function = None
+
+        self.__variables = None
 
     def calculate(self, values: npt.ArrayLike) -> Any:
+        if self._function is None:
+            self._function = self.__compile()
+
         return self._function(*np.asarray(values, dtype=np.float64))
 
     def calculate_interval(
@@ -26,11 +45,35 @@ class Equation:
         times: npt.NDArray[np.float64],
         variables_datatable: Datatable,
     ) -> np.float64:
-        values: npt.NDArray[np.float64] = self.calculate(
-            [variables_datatable[variable.name](times) for variable in self.variables]
+        breakpoints: npt.NDArray[np.float64] = np.union1d(
+            times[[0, -1]],
+            variables_datatable.get_breakpoints(
+                [variable.name for variable in self.variables]
+            ),
+        )
+        points, weights = get_quadrature(
+            breakpoints[(breakpoints >= times[0]) & (breakpoints <= times[-1])]
         )
+        values: npt.NDArray[np.float64] = np.broadcast_to(
+            self.calculate(
+                [
+                    variables_datatable[variable.name](points)
+                    for variable in self.variables
+                ]
+            ),
+            points.shape,
+        )
+
+        return np.float64(values @ weights)
 
-        return np.float64(np.trapezoid(values, times))
+    def copy(self) -> "Equation":
+        equation: Equation = Equation(self.cse)
+
+        equation.expression = self.expression
+        equation._function = self._function
+        equation.__variables = self.__variables
+
+        return equation
 
     def check_continuity(
         self,
@@ -39,17 +82,13 @@ class Equation:
         derivative: bool = False,
     ) -> ContinuityType:
         variable: sp.Symbol = sp.Symbol(raw_variable)
+        expression: sp.Expr = sp.sympify(self.expression)
 
-        if not continuous_domain(self.expression, variable, interval) == interval:
+        if not is_continuous(expression, variable, interval):
             return ContinuityType.DISCONTINUOUS
 
-        if derivative:
-            if (
-                not continuous_domain(
-                    sp.diff(self.expression, variable), variable, interval
-                )
-                == interval
-            ):
+        if derivative and expression.has(variable):
+            if not is_continuous(sp.diff(expression, variable), variable, interval):
                 return ContinuityType.CONTINUOUS
 
         return (
@@ -61,7 +100,7 @@ class Equation:
     def add(self, equation: sp.Expr) -> None:
         self.expression += equation  # type: ignore
 
-        self.__update_function()
+        self.__invalidate()
 
     def subtract(self, equation: sp.Expr) -> None:
         self.add(-equation)
@@ -72,15 +111,34 @@ class Equation:
             {symbol: sp.Symbol(symbol) for symbol in symbols},
         )
 
-        self.__update_function()
+        self.__invalidate()
 
     def subtract_str(self, equation: str, symbols: list[str]) -> None:
         self.add_str(f"-({equation})", symbols)
 
-    def __update_function(self) -> None:
-        variables: list[sp.Symbol] = cast(
-            list[sp.Symbol], list(self.expression.free_symbols)
+    def __compile(self) -> Callable:
+        key: str = get_code_key(
+            "equation",
+            sp.srepr(self.variables),
+            sp.srepr(self.expression),
+            str(self.cse),
+        )
+        code: dict[str, Any] | None = load_code(key, ["function"])
+
+        if code is not None:
+            return code["function"]
+
+        function: Callable = sp.lambdify(
+            self.variables, self.expression, modules="numpy", cse=self.cse
         )
+        source: str | None = get_function_source(function, "function")
+
+        if source is not None:
+            save_code(key, source)
+
+        return function
+
+    def __invalidate(self) -> None:
+        self._function = None
 
-        self.variables = variables
-        self._function = sp.lambdify(variables, self.expression, modules="numpy")
+        self.__variables = None
@@ -0,0 +1,18 @@
+from threading import Lock
+from typing import TypedDict
+
+from classes.common.series_table import SeriesTable
+
+from classes.model.compiled_model import CompiledModel
+from classes.model.runtime_model import RuntimeModel
+from classes.optimal_control.problem import OptimalControlProblem
+
+
+class ModelCacheEntry(TypedDict):
+    runtime_model: RuntimeModel
+    compiled_model: CompiledModel
+    validations: dict[str, str | None]
+    sensitivity_models: dict[str, CompiledModel]
+    interventions: dict[str, SeriesTable]
+    optimal_control_problems: dict[str, OptimalControlProblem]
+    lock: Lock
@@ -0,0 +1,23 @@
+import numpy as np
+import numpy.typing as npt
+
+from classes.common.values import Values
+
+
+class VariablesEvaluator:
+    values: npt.NDArray[np.float64]
+    groups: list[tuple[npt.NDArray[np.intp], Values]]
+
+    def __init__(
+        self,
+        values: npt.NDArray[np.float64],
+        groups: list[tuple[npt.NDArray[np.intp], Values]],
+    ) -> None:
+        self.values = values
+        self.groups = groups
+
+    def __call__(self, time: float) -> npt.NDArray[np.float64]:
+        for indexes, values in self.groups:
+            self.values[indexes] = values.at(time)
+
+        return self.values
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class OptimalControlAlgorithm(str, Enum):
+    SWEEP = "sweep"
+    DIRECT = "direct"
@@ -0,0 +1,8 @@
+from typing import TypedDict
+
+from classes.model.equation import Equation
+
+
+class InterventionUpdate(TypedDict):
+    equation: Equation
+    bang_bang: bool
@@ -0,0 +1,9 @@
+from typing import NotRequired, TypedDict
+
+
+class OptimalControlIteration(TypedDict):
+    objective: float
+    forwardSolves: int
+    duration: float
+    relaxation: NotRequired[float]
+    accelerated: NotRequired[bool]
@@ -1,8 +1,12 @@
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 
+from classes.common.solver_method import SolverMethod
+from classes.common.solver_options import SolverOptions
+from classes.optimal_control.algorithm import OptimalControlAlgorithm
 from classes.optimal_control.intervention_parameters import (
     InterventionParameters,
 )
+from classes.optimal_control.sweep_parameters import SweepParameters
 
 
 class OptimalControlParameters(TypedDict):
@@ -10,3 +14,8 @@ class OptimalControlParameters(TypedDict):
     nodesAmount: int
     objectiveFunction: str
     intervention: InterventionParameters
+    method: NotRequired[SolverMethod]
+    algorithm: NotRequired[OptimalControlAlgorithm]
+    solver: NotRequired[SolverOptions]
+    maxPoints: NotRequired[int]
+    sweep: NotRequired[SweepParameters]
@@ -0,0 +1,15 @@
+from typing import TypedDict
+
+from classes.model.compiled_model import CompiledModel
+from classes.model.equation import Equation
+from classes.optimal_control.adjoint_model import AdjointModel
+from classes.optimal_control.intervention_update import InterventionUpdate
+
+
+class OptimalControlProblem(TypedDict):
+    cost_function: Equation
+    hamiltonian: Equation
+    adjoint_model: AdjointModel
+    compiled_adjoint_model: CompiledModel
+    intervention_partials: dict[str, Equation]
+    intervention_updates: dict[str, InterventionUpdate]
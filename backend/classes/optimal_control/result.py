@@ -1,6 +1,7 @@
 from typing import TypedDict
 
 from classes.common.data import Data
+from classes.optimal_control.iteration import OptimalControlIteration
 
 
 class OptimalControlResult(TypedDict):
@@ -11,3 +12,5 @@ class OptimalControlResult(TypedDict):
     adjointModel: dict[str, str]
     noControlObjective: float
     optimalObjective: float
+    iterations: list[OptimalControlIteration]
+    warmStarted: bool
@@ -0,0 +1,8 @@
+from typing import NotRequired, TypedDict
+
+
+class SweepParameters(TypedDict):
+    maxIterations: NotRequired[int]
+    tolerance: NotRequired[float]
+    acceleration: NotRequired[bool]
+    warmStart: NotRequired[bool]
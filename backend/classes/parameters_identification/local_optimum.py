@@ -0,0 +1,9 @@
+from typing import TypedDict
+
+
+class LocalOptimum(TypedDict):
+    start: dict[str, float]
+    constants: dict[str, float]
+    objective: float
+    iterations: int
+    success: bool
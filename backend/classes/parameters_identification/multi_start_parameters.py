@@ -0,0 +1,9 @@
+from typing import NotRequired, TypedDict
+
+from classes.parameters_identification.sampling_method import SamplingMethod
+
+
+class MultiStartParameters(TypedDict):
+    startsAmount: int
+    sampling: SamplingMethod
+    seed: NotRequired[int]
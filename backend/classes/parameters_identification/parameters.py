@@ -1,6 +1,11 @@
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 
 from classes.common.data import Data
+from classes.common.solver_method import SolverMethod
+from classes.common.solver_options import SolverOptions
+from classes.parameters_identification.multi_start_parameters import (
+    MultiStartParameters,
+)
 from classes.parameters_identification.selected_constant import SelectedConstant
 
 
@@ -9,3 +14,7 @@ class PIParameters(TypedDict):
     forecastTime: float
     selectedConstants: dict[str, SelectedConstant]
     data: dict[str, Data]
+    method: NotRequired[SolverMethod]
+    solver: NotRequired[SolverOptions]
+    maxPoints: NotRequired[int]
+    multiStart: NotRequired[MultiStartParameters]
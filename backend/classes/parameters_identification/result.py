@@ -1,8 +1,10 @@
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 
 from classes.common.data import Data
+from classes.parameters_identification.local_optimum import LocalOptimum
 
 
 class PIResult(TypedDict):
     constants: dict[str, float]
     approximation: dict[str, Data]
+    localOptima: NotRequired[list[LocalOptimum]]
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class SamplingMethod(str, Enum):
+    LATIN_HYPERCUBE = "latin-hypercube"
+    SOBOL = "sobol"
@@ -0,0 +1,9 @@
+from typing import NotRequired
+
+from classes.simulation.parameters import SimulationParameters
+from classes.simulation.scenario import SimulationScenario
+
+
+class BatchSimulationParameters(SimulationParameters):
+    scenarios: list[SimulationScenario]
+    vectorized: NotRequired[bool]
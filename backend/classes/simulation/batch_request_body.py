@@ -0,0 +1,9 @@
+from typing import TypedDict
+
+from classes.model.model import Model
+from classes.simulation.batch_parameters import BatchSimulationParameters
+
+
+class BatchSimulationRequestBody(TypedDict):
+    parameters: BatchSimulationParameters
+    model: Model
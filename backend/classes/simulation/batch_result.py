@@ -0,0 +1,7 @@
+from typing import TypedDict
+
+from classes.simulation.result import SimulationResult
+
+
+class BatchSimulationResult(TypedDict):
+    scenarios: list[SimulationResult]
@@ -0,0 +1,12 @@
+from typing import Literal, TypedDict
+
+from classes.model.model import Model
+from classes.simulation.batch_parameters import BatchSimulationParameters
+from classes.simulation.batch_result import BatchSimulationResult
+
+
+class BatchSimulationSuccessResponse(TypedDict):
+    type: Literal["BatchSimulation"]
+    parameters: BatchSimulationParameters
+    model: Model
+    result: BatchSimulationResult
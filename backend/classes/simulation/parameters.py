@@ -1,6 +1,12 @@
-from typing import TypedDict
+from typing import NotRequired, TypedDict
+
+from classes.common.solver_method import SolverMethod
+from classes.common.solver_options import SolverOptions
 
 
 class SimulationParameters(TypedDict):
     time: float
     nodesAmount: int
+    method: NotRequired[SolverMethod]
+    solver: NotRequired[SolverOptions]
+    maxPoints: NotRequired[int]
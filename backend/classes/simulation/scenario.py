@@ -0,0 +1,6 @@
+from typing import NotRequired, TypedDict
+
+
+class SimulationScenario(TypedDict):
+    constants: NotRequired[dict[str, float]]
+    compartments: NotRequired[dict[str, float]]
@@ -0,0 +1,6 @@
+from typing import TypedDict
+
+
+class BatchValidationRequestBody(TypedDict):
+    expressions: dict[str, str]
+    allowedSymbols: list[str]
@@ -0,0 +1,7 @@
+from typing import TypedDict
+
+from classes.validate_expression.validation_response import ValidationResponse
+
+
+class BatchValidationResponse(TypedDict):
+    results: dict[str, ValidationResponse]
@@ -0,0 +1,6 @@
+from typing import TypedDict
+
+
+class ParsedExpression(TypedDict):
+    valid: bool
+    symbols: list[str]
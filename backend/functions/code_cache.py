@@ -0,0 +1,173 @@
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+from importlib.metadata import version
+from types import CodeType
+from typing import Any, Callable
+
+import numpy as np
+
+CODE_CACHE_VERSION: int = 1
+CODE_CACHE_DIRECTORY: str = os.environ.get(
+    "CODE_CACHE_DIRECTORY",
+    os.path.join(os.path.expanduser("~"), ".cache", "comp-lab", "code"),
+)
+CODE_CACHE_MAX_SIZE: int = int(os.environ.get("CODE_CACHE_MAX_SIZE", 64 * 1024 * 1024))
+CODE_CACHE_EVICT_INTERVAL: int = 64
+CODE_CACHE_EVICT_TARGET: float = 0.75
+CODE_HEADER: str = "from numpy import *\n"
+
+numpy_namespace: dict[str, Any] = {name: getattr(np, name) for name in np.__all__}
+code_cache_size: int | None = None
+code_cache_saves: int = 0
+
+
+def get_code_key(*parts: str) -> str:
+    return hashlib.sha256(
+        json.dumps(
+            [CODE_CACHE_VERSION, version("sympy"), np.__version__, *parts],
+            separators=(",", ":"),
+        ).encode()
+    ).hexdigest()
+
+
+def load_code(
+    key: str, functions: list[str], values: list[str] | None = None
+) -> dict[str, Any] | None:
+    if not CODE_CACHE_DIRECTORY:
+        return None
+
+    path: str = os.path.join(CODE_CACHE_DIRECTORY, f"{key}.py")
+
+    try:
+        with open(path, encoding="utf-8") as file:
+            source: str = file.read()
+
+    except OSError:
+        return None
+
+    try:
+        namespace: dict[str, Any] = {}
+
+        exec(compile(source, path, "exec"), namespace)
+
+        if not all(callable(namespace.get(name)) for name in functions) or not all(
+            name in namespace for name in values or []
+        ):
+            raise ValueError("Cached code is incomplete")
+
+        os.utime(path)
+
+        return namespace
+
+    except Exception:
+        remove_code(path)
+
+        return None
+
+
+def remove_code(path: str) -> None:
+    try:
+        os.remove(path)
+
+    except OSError:
+        pass
+
+
+def save_code(key: str, source: str) -> None:
+    global code_cache_size, code_cache_saves
+
+    if not CODE_CACHE_DIRECTORY:
+        return
+
+    try:
+        os.makedirs(CODE_CACHE_DIRECTORY, 0o700, exist_ok=True)
+
+        descriptor, temporary_path = tempfile.mkstemp(
+            ".tmp", dir=CODE_CACHE_DIRECTORY, text=True
+        )
+
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            file.write(CODE_HEADER + source)
+
+        path: str = os.path.join(CODE_CACHE_DIRECTORY, f"{key}.py")
+
+        os.replace(temporary_path, path)
+
+        code_cache_saves += 1
+
+        if code_cache_size is not None:
+            code_cache_size += os.path.getsize(path)
+
+        if (
+            code_cache_size is None
+            or code_cache_size > CODE_CACHE_MAX_SIZE
+            or code_cache_saves % CODE_CACHE_EVICT_INTERVAL == 0
+        ):
+            code_cache_size = evict_code()
+
+    except OSError:
+        pass
+
+
+def evict_code() -> int:
+    entries: list[tuple[float, int, str]] = []
+
+    for entry in os.scandir(CODE_CACHE_DIRECTORY):
+        if entry.name.endswith(".py"):
+            try:
+                stat: os.stat_result = entry.stat()
+
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+            except OSError:
+                pass
+
+    size: int = sum(entry_size for _, entry_size, _ in entries)
+
+    if size <= CODE_CACHE_MAX_SIZE:
+        return size
+
+    for _, entry_size, path in sorted(entries):
+        if size <= CODE_CACHE_MAX_SIZE * CODE_CACHE_EVICT_TARGET:
+            break
+
+        try:
+            os.remove(path)
+
+        except OSError:
+            pass
+
+        size -= entry_size
+
+    return size
+
+
+def get_function_source(function: Callable, name: str) -> str | None:
+    try:
+        source: str = inspect.getsource(function)
+
+    except (OSError, TypeError):
+        return None
+
+    for global_name in get_code_names(function.__code__):
+        if (
+            global_name in function.__globals__
+            and numpy_namespace.get(global_name)
+            is not function.__globals__[global_name]
+        ):
+            return None
+
+    return source.replace(f"def {function.__name__}(", f"def {name}(", 1)
+
+
+def get_code_names(code: CodeType) -> set[str]:
+    return set(code.co_names).union(
+        *[
+            get_code_names(constant)
+            for constant in code.co_consts
+            if isinstance(constant, CodeType)
+        ]
+    )
@@ -0,0 +1,12 @@
+from classes.common.cache_stats import CacheStats
+from classes.common.pool_cache_stats import PoolCacheStats
+
+
+def combine_cache_stats(workers: list[CacheStats]) -> PoolCacheStats:
+    return {
+        "entries": sum(worker["entries"] for worker in workers),
+        "size": sum(worker["size"] for worker in workers),
+        "hits": sum(worker["hits"] for worker in workers),
+        "misses": sum(worker["misses"] for worker in workers),
+        "workers": workers,
+    }
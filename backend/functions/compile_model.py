@@ -0,0 +1,11 @@
+from classes.model.compiled_model import CompiledModel
+from classes.model.runtime_model import RuntimeModel
+
+
+def compile_model(model: RuntimeModel) -> CompiledModel:
+    return CompiledModel(
+        {
+            name: compartment["equation"]
+            for name, compartment in model["compartments"].items()
+        }
+    )
@@ -0,0 +1,38 @@
+import sympy as sp
+
+from classes.model.compiled_model import CompiledModel
+from classes.model.equation import Equation
+from classes.model.runtime_model import RuntimeModel
+
+
+def get_sensitivity_name(compartment: str, constant: str) -> str:
+    return f"d{compartment}/d{constant}"
+
+
+def compile_sensitivity_model(
+    model: RuntimeModel, constants: list[str]
+) -> CompiledModel:
+    equations: dict[str, Equation] = {
+        name: compartment["equation"]
+        for name, compartment in model["compartments"].items()
+    }
+
+    for constant in constants:
+        for name, compartment in model["compartments"].items():
+            expression: sp.Expr = sp.sympify(compartment["equation"].expression)
+            equation: Equation = Equation()
+
+            equation.add(
+                expression.diff(sp.Symbol(constant))
+                + sp.Add(
+                    *[
+                        expression.diff(sp.Symbol(variable))
+                        * sp.Symbol(get_sensitivity_name(variable, constant))
+                        for variable in model["compartments"]
+                    ]
+                )
+            )
+
+            equations[get_sensitivity_name(name, constant)] = equation
+
+    return CompiledModel(equations)
@@ -0,0 +1,45 @@
+import json
+from typing import Any, Iterator
+
+import numpy as np
+import numpy.typing as npt
+
+BINARY_MIME_TYPE = "application/vnd.comp-lab.binary"
+BINARY_MAGIC = b"CLB1"
+
+
+def encode_binary(result: Any) -> Iterator[bytes | memoryview]:
+    buffers: list[npt.NDArray[np.float64]] = []
+    buffer_indexes: dict[int, int] = {}
+
+    def add_buffer(value: Any) -> Any:
+        if isinstance(value, np.ndarray):
+            if id(value) not in buffer_indexes:
+                buffer_indexes[id(value)] = len(buffers)
+                buffers.append(np.ascontiguousarray(value, dtype="<f8"))
+
+            return {"$buffer": buffer_indexes[id(value)]}
+
+        if isinstance(value, np.generic):
+            return value.item()
+
+        raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+    data: str = json.dumps(result, default=add_buffer)
+
+    offsets: npt.NDArray[np.intp] = np.cumsum(
+        [0, *[buffer.nbytes for buffer in buffers]]
+    )
+    buffers_data: str = json.dumps(
+        [
+            {"offset": offsets[i].item(), "shape": list(buffer.shape)}
+            for i, buffer in enumerate(buffers)
+        ]
+    )
+    header: bytes = f'{{"buffers":{buffers_data},"data":{data}}}'.encode()
+    header += b" " * (-(len(BINARY_MAGIC) + 4 + len(header)) % 8)
+
+    yield BINARY_MAGIC + len(header).to_bytes(4, "little") + header
+
+    for buffer in buffers:
+        yield memoryview(buffer).cast("B")
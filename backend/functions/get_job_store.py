@@ -0,0 +1,20 @@
+import os
+from threading import Lock
+
+from classes.jobs.job_store import JobStore
+
+job_store: JobStore | None = None
+job_store_lock: Lock = Lock()
+
+
+def get_job_store() -> JobStore:
+    global job_store
+
+    with job_store_lock:
+        if job_store is None:
+            job_store = JobStore(
+                int(os.environ.get("JOBS_MAX_AMOUNT", 256)),
+                float(os.environ.get("JOBS_RESULT_TTL", 3600)),
+            )
+
+        return job_store
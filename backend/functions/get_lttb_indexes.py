@@ -0,0 +1,45 @@
+import numpy as np
+import numpy.typing as npt
+
+
+def get_lttb_indexes(
+    times: npt.NDArray[np.float64],
+    values: npt.NDArray[np.float64],
+    max_points: int,
+) -> npt.NDArray[np.intp]:
+    series_amount, size = values.shape
+
+    if max_points < 3:
+        raise RuntimeError("Max points amount must be at least 3")
+
+    if max_points >= size:
+        return np.broadcast_to(np.arange(size), (series_amount, size))
+
+    edges: npt.NDArray[np.intp] = np.append(
+        np.linspace(1, size - 1, max_points - 1).astype(np.intp), size
+    )
+    rows: npt.NDArray[np.intp] = np.arange(series_amount)
+    indexes: npt.NDArray[np.intp] = np.empty((series_amount, max_points), np.intp)
+
+    indexes[:, 0] = 0
+    indexes[:, -1] = size - 1
+
+    for i in range(max_points - 2):
+        start, end, next_end = edges[i], edges[i + 1], edges[i + 2]
+
+        average_time: np.float64 = times[end:next_end].mean()
+        average_values: npt.NDArray[np.float64] = values[:, end:next_end].mean(axis=1)
+
+        previous: npt.NDArray[np.intp] = indexes[:, i]
+        previous_times: npt.NDArray[np.float64] = times[previous][:, np.newaxis]
+        previous_values: npt.NDArray[np.float64] = values[rows, previous][:, np.newaxis]
+
+        areas: npt.NDArray[np.float64] = np.abs(
+            (previous_times - average_time) * (values[:, start:end] - previous_values)
+            - (previous_times - times[start:end])
+            * (average_values[:, np.newaxis] - previous_values)
+        )
+
+        indexes[:, i + 1] = start + np.argmax(areas, axis=1)
+
+    return indexes
@@ -0,0 +1,26 @@
+import hashlib
+import json
+
+from classes.model.model import Model
+
+
+def get_model_hash(model: Model) -> str:
+    names: dict[str, str] = {
+        compartment["id"]: compartment["name"] for compartment in model["compartments"]
+    }
+
+    canonical_model: dict[str, list] = {
+        "compartments": [compartment["name"] for compartment in model["compartments"]],
+        "constants": sorted(constant["name"] for constant in model["constants"]),
+        "interventions": sorted(
+            intervention["name"] for intervention in model["interventions"]
+        ),
+        "flows": sorted(
+            [names[flow["source"]], names[flow["target"]], flow["equation"]]
+            for flow in model["flows"]
+        ),
+    }
+
+    return hashlib.sha256(
+        json.dumps(canonical_model, separators=(",", ":")).encode()
+    ).hexdigest()
@@ -0,0 +1,16 @@
+import numpy as np
+import numpy.typing as npt
+
+
+def get_quadrature(
+    breakpoints: npt.NDArray[np.float64], order: int = 3
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    nodes, weights = np.polynomial.legendre.leggauss(order)
+    breakpoints = np.unique(breakpoints)
+    centers: npt.NDArray[np.float64] = (breakpoints[1:] + breakpoints[:-1]) / 2
+    radiuses: npt.NDArray[np.float64] = np.diff(breakpoints) / 2
+
+    return (
+        (centers[:, np.newaxis] + radiuses[:, np.newaxis] * nodes).ravel(),
+        (radiuses[:, np.newaxis] * weights).ravel(),
+    )
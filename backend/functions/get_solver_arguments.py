@@ -0,0 +1,32 @@
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from classes.common.solver_options import SolverOptions
+
+
+def get_solver_arguments(
+    times: npt.NDArray[np.float64],
+    options: SolverOptions | None = None,
+    dense: bool = False,
+) -> dict[str, Any]:
+    options = options or {}
+    arguments: dict[str, Any] = (
+        {"dense_output": True}
+        if options.get("adaptive", False)
+        else {"t_eval": times, "dense_output": dense}
+    )
+
+    for option, argument in (
+        ("rtol", "rtol"),
+        ("atol", "atol"),
+        ("maxStep", "max_step"),
+    ):
+        if option in options:
+            if not options[option] > 0:
+                raise RuntimeError(f'Solver option "{option}" must be positive')
+
+            arguments[argument] = options[option]
+
+    return arguments
@@ -0,0 +1,30 @@
+import os
+from threading import Lock
+
+from classes.common.lazy_function import LazyFunction
+from classes.common.worker_pool import WorkerPool
+from functions.warm_up_worker import WARM_UP_MODULES, warm_up_worker
+
+worker_pool: WorkerPool | None = None
+worker_pool_lock: Lock = Lock()
+
+
+def get_worker_pool() -> WorkerPool:
+    global worker_pool
+
+    with worker_pool_lock:
+        if worker_pool is None:
+            worker_pool = WorkerPool(
+                int(os.environ.get("WORKERS", os.cpu_count() or 1)),
+                int(os.environ.get("WORKER_QUEUE_LIMIT", 16)),
+                (
+                    float(os.environ["WORKER_JOB_TIMEOUT"])
+                    if "WORKER_JOB_TIMEOUT" in os.environ
+                    else None
+                ),
+                warm_up_worker,
+                LazyFunction("functions.model_cache", "get_model_cache_stats"),
+                WARM_UP_MODULES,
+            )
+
+        return worker_pool
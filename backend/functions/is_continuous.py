@@ -0,0 +1,40 @@
+from functools import lru_cache
+import sympy as sp
+from sympy.calculus.util import continuous_domain
+
+CONTINUOUS_FUNCTIONS: tuple[type, ...] = (
+    sp.exp,
+    sp.sin,
+    sp.cos,
+    sp.sinh,
+    sp.cosh,
+    sp.tanh,
+    sp.atan,
+    sp.Abs,
+    sp.Max,
+    sp.Min,
+)
+
+
+@lru_cache(maxsize=4096)
+def is_continuous(
+    expression: sp.Expr,
+    variable: sp.Symbol,
+    interval: sp.Set,
+) -> bool:
+    if not expression.has(variable) or expression.is_polynomial(variable):
+        return True
+
+    if isinstance(expression, (sp.Add, sp.Mul, *CONTINUOUS_FUNCTIONS)):
+        return all(
+            is_continuous(argument, variable, interval) for argument in expression.args
+        )
+
+    if (
+        isinstance(expression, sp.Pow)
+        and expression.exp.is_Integer
+        and expression.exp.is_positive
+    ):
+        return is_continuous(expression.base, variable, interval)
+
+    return continuous_domain(expression, variable, interval) == interval
@@ -0,0 +1,176 @@
+import os
+from threading import Lock
+from typing import Callable
+
+from classes.common.cache_stats import CacheStats
+from classes.common.lru_cache import LRUCache
+from classes.common.series_table import SeriesTable
+from classes.model.compiled_model import CompiledModel
+from classes.model.model import Model
+from classes.model.model_cache_entry import ModelCacheEntry
+from classes.model.runtime_model import RuntimeModel
+from classes.optimal_control.problem import OptimalControlProblem
+from functions.compile_model import compile_model
+from functions.compile_sensitivity_model import compile_sensitivity_model
+from functions.get_model_hash import get_model_hash
+from functions.model_to_runtime_model import model_to_runtime_model
+
+MAX_VALIDATIONS: int = 64
+MAX_INTERVENTIONS: int = 16
+MAX_OPTIMAL_CONTROL_PROBLEMS: int = 16
+
+
+def get_model_cache_entry_size(entry: ModelCacheEntry) -> int:
+    return entry["compiled_model"].size + sum(
+        len(str(compartment["equation"].expression))
+        for compartment in entry["runtime_model"]["compartments"].values()
+    )
+
+
+model_cache: LRUCache[str, ModelCacheEntry] = LRUCache(
+    int(os.environ.get("MODEL_CACHE_MAX_ENTRIES", 128)),
+    int(os.environ.get("MODEL_CACHE_MAX_SIZE", 64 * 1024 * 1024)),
+    get_model_cache_entry_size,
+)
+
+
+def get_cached_model(model: Model) -> ModelCacheEntry:
+    key: str = get_model_hash(model)
+    entry: ModelCacheEntry | None = model_cache.get(key)
+
+    if entry is None:
+        runtime_model: RuntimeModel = model_to_runtime_model(model)
+        entry = {
+            "runtime_model": runtime_model,
+            "compiled_model": compile_model(runtime_model),
+            "validations": {},
+            "sensitivity_models": {},
+            "interventions": {},
+            "optimal_control_problems": {},
+            "lock": Lock(),
+        }
+
+        model_cache.set(key, entry)
+
+    return {
+        **entry,
+        "runtime_model": {
+            **model,
+            "compartments": {
+                compartment["name"]: {
+                    **compartment,
+                    "equation": entry["runtime_model"]["compartments"][
+                        compartment["name"]
+                    ]["equation"],
+                }
+                for compartment in model["compartments"]
+            },
+        },
+    }
+
+
+def validate_cached(
+    entry: ModelCacheEntry,
+    key: str,
+    validate: Callable[[], None],
+) -> None:
+    validations: dict[str, str | None] = entry["validations"]
+
+    with entry["lock"]:
+        cached: bool = key in validations
+        error: str | None = validations.get(key)
+
+    if cached:
+        if error is not None:
+            raise RuntimeError(error)
+
+        return
+
+    try:
+        validate()
+
+    except RuntimeError as validation_error:
+        set_validation(entry, key, str(validation_error))
+
+        raise
+
+    set_validation(entry, key, None)
+
+
+def set_validation(entry: ModelCacheEntry, key: str, error: str | None) -> None:
+    validations: dict[str, str | None] = entry["validations"]
+
+    with entry["lock"]:
+        validations[key] = error
+
+        while len(validations) > MAX_VALIDATIONS:
+            validations.pop(next(iter(validations)), None)
+
+
+def get_cached_sensitivity_model(
+    entry: ModelCacheEntry, constants: list[str]
+) -> CompiledModel:
+    key: str = ",".join(constants)
+
+    with entry["lock"]:
+        sensitivity_model: CompiledModel | None = entry["sensitivity_models"].get(key)
+
+    if sensitivity_model is None:
+        sensitivity_model = compile_sensitivity_model(entry["runtime_model"], constants)
+
+        with entry["lock"]:
+            sensitivity_model = entry["sensitivity_models"].setdefault(
+                key, sensitivity_model
+            )
+
+    return sensitivity_model
+
+
+def get_cached_optimal_control_problem(
+    entry: ModelCacheEntry,
+    key: str,
+    create: Callable[[], OptimalControlProblem],
+) -> OptimalControlProblem:
+    problems: dict[str, OptimalControlProblem] = entry["optimal_control_problems"]
+
+    with entry["lock"]:
+        problem: OptimalControlProblem | None = problems.get(key)
+
+    if problem is None:
+        problem = create()
+
+        with entry["lock"]:
+            problem = problems.setdefault(key, problem)
+
+            while len(problems) > MAX_OPTIMAL_CONTROL_PROBLEMS:
+                problems.pop(next(iter(problems)), None)
+
+    return problem
+
+
+def get_cached_interventions(entry: ModelCacheEntry, key: str) -> SeriesTable | None:
+    with entry["lock"]:
+        return entry["interventions"].get(key)
+
+
+def set_cached_interventions(
+    entry: ModelCacheEntry, key: str, interventions: SeriesTable
+) -> None:
+    with entry["lock"]:
+        entry["interventions"].pop(key, None)
+        entry["interventions"][key] = interventions
+
+        while len(entry["interventions"]) > MAX_INTERVENTIONS:
+            entry["interventions"].pop(next(iter(entry["interventions"])), None)
+
+
+def get_model_cache_stats() -> CacheStats:
+    return {
+        "process": os.getpid(),
+        "entries": len(model_cache),
+        "size": model_cache.size,
+        "maxEntries": model_cache.max_entries,
+        "maxSize": model_cache.max_size,
+        "hits": model_cache.hits,
+        "misses": model_cache.misses,
+    }
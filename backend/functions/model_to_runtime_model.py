@@ -1,37 +1,89 @@
+import json
+import os
+import re
+
+import sympy as sp
+
+from classes.common.lru_cache import LRUCache
 from classes.model.equation import Equation
 from classes.model.model import Model
-from classes.model.runtime_compartment import RuntimeCompartment
 from classes.model.runtime_model import RuntimeModel
 
+compartment_equations: LRUCache[str, Equation] = LRUCache(
+    int(os.environ.get("COMPARTMENT_EQUATION_CACHE_MAX_ENTRIES", 1024)),
+    int(os.environ.get("COMPARTMENT_EQUATION_CACHE_MAX_SIZE", 16 * 1024 * 1024)),
+    lambda equation: len(str(equation.expression)),
+)
+
 
 def model_to_runtime_model(model: Model) -> RuntimeModel:
-    symbols: list[str] = [
+    symbols: set[str] = {
         *[compartment["name"] for compartment in model["compartments"]],
         *[constant["name"] for constant in model["constants"]],
         *[intervention["name"] for intervention in model["interventions"]],
-    ]
-
-    runtime_compartments: dict[str, RuntimeCompartment] = {
-        compartment["name"]: {
-            **compartment,
-            "equation": Equation(),
-        }
-        for compartment in model["compartments"]
     }
+    flows: dict[str, list[tuple[int, str]]] = {
+        compartment["id"]: [] for compartment in model["compartments"]
+    }
+    expressions: dict[str, sp.Expr] = {}
 
     for flow in model["flows"]:
-        source: RuntimeCompartment = next(
-            runtime_compartment
-            for runtime_compartment in runtime_compartments.values()
-            if runtime_compartment["id"] == flow["source"]
-        )
-        target: RuntimeCompartment = next(
-            runtime_compartment
-            for runtime_compartment in runtime_compartments.values()
-            if runtime_compartment["id"] == flow["target"]
-        )
+        flows[flow["source"]].append((-1, flow["equation"]))
+        flows[flow["target"]].append((1, flow["equation"]))
+
+    return {
+        **model,
+        "compartments": {
+            compartment["name"]: {
+                **compartment,
+                "equation": get_compartment_equation(
+                    sorted(flows[compartment["id"]]), symbols, expressions
+                ),
+            }
+            for compartment in model["compartments"]
+        },
+    }
 
-        source["equation"].subtract_str(flow["equation"], symbols)
-        target["equation"].add_str(flow["equation"], symbols)
 
-    return {**model, "compartments": runtime_compartments}
+def get_compartment_equation(
+    flows: list[tuple[int, str]],
+    symbols: set[str],
+    expressions: dict[str, sp.Expr],
+) -> Equation:
+    used_symbols: list[str] = sorted(
+        {name for _, equation in flows for name in re.findall(r"\w+", equation)}
+        & symbols
+    )
+    key: str = json.dumps([flows, used_symbols], separators=(",", ":"))
+    equation: Equation | None = compartment_equations.get(key)
+
+    if equation is None:
+        equation = Equation()
+
+        if flows:
+            equation.add(
+                sp.Add(
+                    *[
+                        sign * get_flow_expression(flow, used_symbols, expressions)
+                        for sign, flow in flows
+                    ]
+                )
+            )
+
+        compartment_equations.set(key, equation)
+
+    return equation.copy()
+
+
+def get_flow_expression(
+    flow: str,
+    symbols: list[str],
+    expressions: dict[str, sp.Expr],
+) -> sp.Expr:
+    if flow not in expressions:
+        expressions[flow] = sp.sympify(
+            flow.replace("^", "**"),
+            {symbol: sp.Symbol(symbol) for symbol in symbols},
+        )
+
+    return expressions[flow]
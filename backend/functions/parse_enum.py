@@ -0,0 +1,15 @@
+from enum import Enum
+from typing import Any, TypeVar
+
+E = TypeVar("E", bound=Enum)
+
+
+def parse_enum(enum: type[E], value: Any, name: str) -> E:
+    try:
+        return enum(value)
+
+    except ValueError:
+        raise RuntimeError(
+            f'Unknown {name} "{value}"\n'
+            + f"Allowed values: {", ".join(str(member.value) for member in enum)}"
+        )
@@ -0,0 +1,96 @@
+import ast
+import builtins
+import os
+import re
+
+import sympy as sp
+from sympy.abc import _clash
+
+from classes.common.lru_cache import LRUCache
+from classes.validate_expression.parsed_expression import ParsedExpression
+
+CLASHING_SYMBOLS: dict[str, sp.Symbol] = {
+    name: sp.Symbol(name) for name in _clash if name
+}
+RESERVED_NAMES: set[str] = (set(sp.__all__) | set(dir(builtins))) - set(
+    CLASHING_SYMBOLS
+)
+ARITHMETIC_PATTERN: re.Pattern[str] = re.compile(r"[A-Za-z0-9_ +\-*/^().]*")
+SPLIT_OPERATOR_PATTERN: re.Pattern[str] = re.compile(r"[*/^] +[*/^]")
+ARITHMETIC_NODES: tuple[type[ast.AST], ...] = (
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.Pow,
+    ast.UAdd,
+    ast.USub,
+    ast.Load,
+)
+
+parsed_expressions: LRUCache[str, ParsedExpression] = LRUCache(
+    int(os.environ.get("EXPRESSION_CACHE_MAX_ENTRIES", 4096)),
+    int(os.environ.get("EXPRESSION_CACHE_MAX_SIZE", 1024 * 1024)),
+    lambda parsed: 1 + sum(len(symbol) for symbol in parsed["symbols"]),
+)
+
+
+def parse_expression(expression: str) -> ParsedExpression:
+    parsed: ParsedExpression | None = parsed_expressions.get(expression)
+
+    if parsed is None:
+        parsed = pre_parse_expression(expression) or sympify_expression(expression)
+
+        parsed_expressions.set(expression, parsed)
+
+    return parsed
+
+
+def pre_parse_expression(expression: str) -> ParsedExpression | None:
+    if not ARITHMETIC_PATTERN.fullmatch(expression) or SPLIT_OPERATOR_PATTERN.search(
+        expression
+    ):
+        return None
+
+    try:
+        tree: ast.Expression = ast.parse(
+            expression.strip().replace("^", "**"), mode="eval"
+        )
+
+    except SyntaxError:
+        return {"valid": False, "symbols": []}
+
+    except (RecursionError, MemoryError):
+        return None
+
+    symbols: set[str] = set()
+
+    for node in ast.walk(tree.body):
+        if isinstance(node, ast.Name) and node.id not in RESERVED_NAMES:
+            symbols.add(node.id)
+
+        elif not isinstance(node, ARITHMETIC_NODES) and not (
+            isinstance(node, ast.Constant) and type(node.value) in (int, float)
+        ):
+            return None
+
+    return {"valid": True, "symbols": sorted(symbols)}
+
+
+def sympify_expression(expression: str) -> ParsedExpression:
+    try:
+        symbolic_expression: sp.Expr = sp.sympify(
+            expression, evaluate=False, locals=dict(CLASHING_SYMBOLS)
+        )
+
+        return {
+            "valid": True,
+            "symbols": sorted(
+                str(symbol) for symbol in symbolic_expression.free_symbols
+            ),
+        }
+
+    except Exception:
+        return {"valid": False, "symbols": []}
@@ -0,0 +1,23 @@
+from concurrent.futures import Future
+from threading import Thread
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def run_in_thread(function: Callable[..., T], *args: Any) -> "Future[T]":
+    future: Future[T] = Future()
+
+    future.set_running_or_notify_cancel()
+
+    Thread(target=resolve_future, args=(future, function, *args), daemon=True).start()
+
+    return future
+
+
+def resolve_future(future: Future, function: Callable[..., Any], *args: Any) -> None:
+    try:
+        future.set_result(function(*args))
+
+    except BaseException as error:
+        future.set_exception(error)
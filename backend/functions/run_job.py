@@ -0,0 +1,62 @@
+from functools import partial
+from multiprocessing.managers import DictProxy
+from typing import Any
+
+from classes.common.lazy_function import LazyFunction
+from classes.jobs.job_type import JobType
+from classes.model.model import Model
+
+simulation: LazyFunction[Any] = LazyFunction("middleware.simulation", "simulation")
+batch_simulation: LazyFunction[Any] = LazyFunction(
+    "middleware.batch_simulation", "batch_simulation"
+)
+optimal_control: LazyFunction[Any] = LazyFunction(
+    "middleware.optimal_control", "optimal_control"
+)
+parameters_identification: LazyFunction[Any] = LazyFunction(
+    "middleware.parameters_identification", "parameters_identification"
+)
+
+
+def run_job(
+    job_type: JobType,
+    parameters: Any,
+    model: Model,
+    job_id: str,
+    progress: DictProxy,
+    cancellations: DictProxy,
+) -> Any:
+    if job_id in cancellations:
+        raise RuntimeError("Job was cancelled")
+
+    if job_type is JobType.SIMULATION:
+        return simulation(parameters, model)
+
+    if job_type is JobType.BATCH_SIMULATION:
+        return batch_simulation(parameters, model)
+
+    report_progress = partial(report_job_progress, job_id, progress, cancellations)
+
+    if job_type is JobType.OPTIMAL_CONTROL:
+        return optimal_control(parameters, model, report_progress)
+
+    if job_type is JobType.PARAMETERS_IDENTIFICATION:
+        return parameters_identification(parameters, model, report_progress)
+
+    raise ValueError("Job type not supported")
+
+
+def report_job_progress(
+    job_id: str,
+    progress: DictProxy,
+    cancellations: DictProxy,
+    iteration: int,
+    max_iterations: int,
+) -> None:
+    if job_id in cancellations:
+        raise RuntimeError("Job was cancelled")
+
+    progress[job_id] = {
+        "iteration": iteration,
+        "maxIterations": max_iterations,
+    }
@@ -0,0 +1,209 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, TimeoutError, wait
+from functools import partial
+from multiprocessing.managers import DictProxy
+from time import monotonic
+from typing import Any
+
+from classes.common.error_response import ErrorResponse
+from classes.common.lazy_function import LazyFunction
+from classes.common.worker_pool import WorkerPool
+from classes.model.model import Model
+from classes.parameters_identification.local_optimum import LocalOptimum
+from classes.parameters_identification.parameters import PIParameters
+from classes.parameters_identification.success_response import PISuccessResponse
+from functions.run_job import report_job_progress
+
+MULTI_START_MAX_TASKS: int = int(os.environ.get("MULTI_START_MAX_TASKS", 4))
+MULTI_START_PROGRESS_INTERVAL: float = 0.5
+
+prepare_multi_start: LazyFunction[list[dict[str, float]]] = LazyFunction(
+    "middleware.parameters_identification", "prepare_multi_start"
+)
+identify_start: LazyFunction[LocalOptimum] = LazyFunction(
+    "middleware.parameters_identification", "identify_start"
+)
+parameters_identification: LazyFunction[PISuccessResponse | ErrorResponse] = (
+    LazyFunction("middleware.parameters_identification", "parameters_identification")
+)
+
+
+def run_multi_start(
+    pool: WorkerPool,
+    parameters: PIParameters,
+    model: Model,
+    timeout: float | None,
+    job_id: str | None = None,
+    progress: DictProxy | None = None,
+    cancellations: DictProxy | None = None,
+) -> PISuccessResponse | ErrorResponse:
+    deadline: float | None = monotonic() + timeout if timeout is not None else None
+    running: dict[Future[LocalOptimum], int] = {}
+    starts: list[dict[str, float]] = []
+
+    try:
+        starts = wait_for_task(
+            pool,
+            pool.submit(
+                prepare_multi_start,
+                parameters,
+                model,
+                wait=get_remaining_time(deadline),
+            ),
+            deadline,
+            timeout,
+        )
+        pending: list[int] = list(range(len(starts)))
+        max_tasks: int = max(min(MULTI_START_MAX_TASKS, pool.workers), 1)
+        local_optima: list[LocalOptimum] = []
+        errors: list[str] = []
+        started: list[int] = []
+
+        while len(pending) or len(running):
+            while len(pending) and len(running) < max_tasks:
+                index: int = pending.pop(0)
+
+                started.append(index)
+                running[
+                    pool.submit(
+                        identify_start,
+                        parameters,
+                        model,
+                        starts[index],
+                        (
+                            partial(
+                                report_start_progress,
+                                job_id,
+                                index,
+                                progress,
+                                cancellations,
+                            )
+                            if job_id is not None
+                            else None
+                        ),
+                        wait=get_remaining_time(deadline),
+                    )
+                ] = index
+
+            remaining_time: float | None = get_remaining_time(deadline)
+            done, _ = wait(
+                running,
+                timeout=(
+                    min(MULTI_START_PROGRESS_INTERVAL, remaining_time)
+                    if remaining_time is not None
+                    else MULTI_START_PROGRESS_INTERVAL
+                ),
+                return_when=FIRST_COMPLETED,
+            )
+
+            for future in done:
+                running.pop(future)
+
+                try:
+                    local_optima.append(future.result())
+
+                except RuntimeError as error:
+                    errors.append(str(error))
+
+            if remaining_time is not None and remaining_time <= 0:
+                raise RuntimeError(f"Job did not finish in {timeout} seconds")
+
+            if (
+                job_id is not None
+                and progress is not None
+                and cancellations is not None
+            ):
+                reports: dict[int, tuple[int, int]] = {
+                    index: progress.get((job_id, index), (0, 0)) for index in started
+                }
+                max_iterations: int = max(
+                    [0, *[report[1] for report in reports.values()]]
+                )
+
+                report_job_progress(
+                    job_id,
+                    progress,
+                    cancellations,
+                    sum(
+                        (
+                            min(report[0], max_iterations)
+                            if index in running.values()
+                            else max_iterations
+                        )
+                        for index, report in reports.items()
+                    ),
+                    len(starts) * max_iterations,
+                )
+
+        if not len(local_optima):
+            raise RuntimeError(errors[0] if len(errors) else "No starting points")
+
+        return wait_for_task(
+            pool,
+            pool.submit(
+                parameters_identification,
+                parameters,
+                model,
+                None,
+                local_optima,
+                wait=get_remaining_time(deadline),
+            ),
+            deadline,
+            timeout,
+        )
+
+    except RuntimeError as error:
+        return ErrorResponse(
+            {
+                "error": str(error),
+            }
+        )
+
+    except Exception as error:
+        print(error)
+
+        return ErrorResponse(
+            {
+                "error": "There is an error in the back end",
+            }
+        )
+
+    finally:
+        for future in running:
+            pool.terminate(future, RuntimeError("Job was cancelled"))
+
+        if job_id is not None and progress is not None:
+            for index in range(len(starts)):
+                progress.pop((job_id, index), None)
+
+
+def wait_for_task(
+    pool: WorkerPool, future: Future, deadline: float | None, timeout: float | None
+) -> Any:
+    try:
+        return future.result(timeout=get_remaining_time(deadline))
+
+    except TimeoutError:
+        error: RuntimeError = RuntimeError(f"Job did not finish in {timeout} seconds")
+
+        pool.terminate(future, error)
+
+        raise error
+
+
+def get_remaining_time(deadline: float | None) -> float | None:
+    return max(deadline - monotonic(), 0) if deadline is not None else None
+
+
+def report_start_progress(
+    job_id: str,
+    index: int,
+    progress: DictProxy,
+    cancellations: DictProxy,
+    iteration: int,
+    max_iterations: int,
+) -> None:
+    if job_id in cancellations:
+        raise RuntimeError("Job was cancelled")
+
+    progress[(job_id, index)] = (iteration, max_iterations)
@@ -0,0 +1,42 @@
+from typing import Any
+
+import numpy as np
+
+from classes.common.shared_data import SharedData
+
+SHARED_TIMES_MIME_TYPE = "application/vnd.comp-lab.shared-times+json"
+
+
+def share_times(result: Any) -> Any:
+    if isinstance(result, list):
+        return [share_times(value) for value in result]
+
+    if not isinstance(result, dict):
+        return result
+
+    shared_data: SharedData | None = get_shared_data(result)
+
+    if shared_data is not None:
+        return shared_data
+
+    return {key: share_times(value) for key, value in result.items()}
+
+
+def get_shared_data(series: dict[str, Any]) -> SharedData | None:
+    if not len(series) or not all(
+        isinstance(data, dict) and data.keys() == {"times", "values"}
+        for data in series.values()
+    ):
+        return None
+
+    times: Any = next(iter(series.values()))["times"]
+
+    if not isinstance(times, np.ndarray) or any(
+        data["times"] is not times for data in series.values()
+    ):
+        return None
+
+    return {
+        "times": times,
+        "values": {name: data["values"] for name, data in series.items()},
+    }
@@ -1,25 +1,44 @@
 import numpy as np
 import numpy.typing as npt
 from scipy.integrate import solve_ivp
+from scipy.sparse import csc_matrix
 
-from classes.common.values import Values
+from classes.common.dense_solution import DenseSolution
+from classes.common.solver_method import SolverMethod
+from classes.common.solver_options import SolverOptions
+from classes.common.series_table import SeriesTable
+from classes.model.compiled_model import CompiledModel
 from classes.model.runtime_compartment import RuntimeCompartment
 from classes.model.runtime_model import RuntimeModel
 from classes.model.datatable import Datatable
+from classes.model.variables_evaluator import VariablesEvaluator
+from functions.get_solver_arguments import get_solver_arguments
 
 
 def simulate(
     model: RuntimeModel,
+    compiled_model: CompiledModel,
     times: npt.NDArray[np.float64],
     variables_datatable: Datatable,
+    method: SolverMethod = SolverMethod.LSODA,
+    options: SolverOptions | None = None,
+    dense: bool = False,
 ) -> None:
     result = solve_ivp(
         fun=__calculate_model,
         t_span=(times[0], times[-1]),
         y0=[compartment["value"] for compartment in model["compartments"].values()],
-        args=(model, variables_datatable),
-        method="LSODA",
-        t_eval=times,
+        args=(
+            compiled_model,
+            variables_datatable.get_variables_evaluator(compiled_model.variables),
+        ),
+        method=method.value,
+        jac=(
+            __calculate_jacobian
+            if method is SolverMethod.LSODA
+            else __calculate_sparse_jacobian
+        ),
+        **get_solver_arguments(times, options, dense),
     )
 
     if not all([y.min() >= -1e-6 for y in result.y]):
@@ -36,41 +55,41 @@ def simulate(
         raise RuntimeError(f"Negative value for {compartment["name"]} at time {time}")
 
     variables_datatable.set_compartments(
-        {
-            name: Values(
-                result.t,
-                result.y[i],
-            )
-            for i, name in enumerate(model["compartments"])
-        }
+        SeriesTable(
+            result.t,
+            result.y,
+            list(model["compartments"]),
+            solution=(
+                DenseSolution(result.sol, np.arange(result.y.shape[0]))
+                if result.sol is not None
+                else None
+            ),
+        )
     )
 
 
 def __calculate_model(
     t: np.float64,
     y: npt.NDArray[np.float64],
-    model: RuntimeModel,
-    variables_datatable: Datatable,
+    compiled_model: CompiledModel,
+    variables: VariablesEvaluator,
 ) -> npt.NDArray[np.float64]:
-    names = list(model["compartments"].keys())
-    compartments = list(model["compartments"].values())
+    return compiled_model.calculate(y, variables(t))
 
-    return np.array(
-        [
-            compartment["equation"].calculate(
-                np.array(
-                    [
-                        (
-                            y[names.index(variable.name)]
-                            if variable.name in model["compartments"]
-                            else variables_datatable[variable.name](t)
-                        )
-                        for variable in compartment["equation"].variables
-                    ],
-                    dtype=np.float64,
-                )
-            )
-            for compartment in compartments
-        ],
-        dtype=np.float64,
-    )
+
+def __calculate_jacobian(
+    t: np.float64,
+    y: npt.NDArray[np.float64],
+    compiled_model: CompiledModel,
+    variables: VariablesEvaluator,
+) -> npt.NDArray[np.float64]:
+    return compiled_model.calculate_jacobian(y, variables(t))
+
+
+def __calculate_sparse_jacobian(
+    t: np.float64,
+    y: npt.NDArray[np.float64],
+    compiled_model: CompiledModel,
+    variables: VariablesEvaluator,
+) -> csc_matrix:
+    return compiled_model.calculate_sparse_jacobian(y, variables(t))
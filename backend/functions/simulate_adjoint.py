@@ -1,62 +1,79 @@
 import numpy as np
 import numpy.typing as npt
 from scipy.integrate import solve_ivp
+from scipy.sparse import csc_matrix
 
-from classes.common.values import Values
+from classes.common.dense_solution import DenseSolution
+from classes.common.solver_method import SolverMethod
+from classes.common.solver_options import SolverOptions
+from classes.common.series_table import SeriesTable
+from classes.model.compiled_model import CompiledModel
 from classes.model.datatable import Datatable
-from classes.optimal_control.adjoint_model import AdjointModel
+from classes.model.variables_evaluator import VariablesEvaluator
+from functions.get_solver_arguments import get_solver_arguments
 
 
 def simulate_adjoint(
-    model: AdjointModel,
+    compiled_model: CompiledModel,
     times: npt.NDArray[np.float64],
     variables_datatable: Datatable,
+    method: SolverMethod = SolverMethod.LSODA,
+    options: SolverOptions | None = None,
+    dense: bool = False,
 ) -> None:
     result = solve_ivp(
         fun=__calculate_model,
         t_span=(times[-1], times[0]),
-        y0=[0] * len(model["lambdas"]),
-        args=(model, variables_datatable),
-        method="LSODA",
-        t_eval=np.flip(times),
+        y0=[0] * len(compiled_model.names),
+        args=(
+            compiled_model,
+            variables_datatable.get_variables_evaluator(compiled_model.variables),
+        ),
+        method=method.value,
+        jac=(
+            __calculate_jacobian
+            if method is SolverMethod.LSODA
+            else __calculate_sparse_jacobian
+        ),
+        **get_solver_arguments(np.flip(times), options, dense),
     )
 
     variables_datatable.set_lambdas(
-        {
-            name: Values(
-                result.t[::-1],
-                result.y[i][::-1],
-            )
-            for i, name in enumerate(model["lambdas"])
-        }
+        SeriesTable(
+            result.t[::-1],
+            result.y[:, ::-1],
+            compiled_model.names,
+            solution=(
+                DenseSolution(result.sol, np.arange(result.y.shape[0]))
+                if result.sol is not None
+                else None
+            ),
+        )
     )
 
 
 def __calculate_model(
     t: np.float64,
     y: npt.NDArray[np.float64],
-    model: AdjointModel,
-    variables_datatable: Datatable,
+    compiled_model: CompiledModel,
+    variables: VariablesEvaluator,
 ) -> npt.NDArray[np.float64]:
-    names = list(model["lambdas"].keys())
-    lambdas = list(model["lambdas"].values())
-
-    return np.array(
-        [
-            equation.calculate(
-                np.array(
-                    [
-                        (
-                            y[names.index(variable.name)]
-                            if variable.name in model["lambdas"]
-                            else variables_datatable[variable.name](t)
-                        )
-                        for variable in equation.variables
-                    ],
-                    dtype=np.float64,
-                )
-            )
-            for equation in lambdas
-        ],
-        dtype=np.float64,
-    )
+    return compiled_model.calculate(y, variables(t))
+
+
+def __calculate_jacobian(
+    t: np.float64,
+    y: npt.NDArray[np.float64],
+    compiled_model: CompiledModel,
+    variables: VariablesEvaluator,
+) -> npt.NDArray[np.float64]:
+    return compiled_model.calculate_jacobian(y, variables(t))
+
+
+def __calculate_sparse_jacobian(
+    t: np.float64,
+    y: npt.NDArray[np.float64],
+    compiled_model: CompiledModel,
+    variables: VariablesEvaluator,
+) -> csc_matrix:
+    return compiled_model.calculate_sparse_jacobian(y, variables(t))
@@ -0,0 +1,105 @@
+import numpy as np
+import numpy.typing as npt
+from scipy.integrate import solve_ivp
+from scipy.sparse import csc_matrix
+
+from classes.common.solver_method import SolverMethod
+from classes.common.solver_options import SolverOptions
+from classes.common.series_table import SeriesTable
+from classes.model.compiled_model import CompiledModel
+from classes.model.runtime_model import RuntimeModel
+from functions.get_solver_arguments import get_solver_arguments
+
+
+def simulate_batch(
+    model: RuntimeModel,
+    compiled_model: CompiledModel,
+    times: npt.NDArray[np.float64],
+    initial_values: npt.NDArray[np.float64],
+    variables: npt.NDArray[np.float64],
+    method: SolverMethod = SolverMethod.LSODA,
+    options: SolverOptions | None = None,
+) -> list[SeriesTable]:
+    scenarios_amount, compartments_amount = initial_values.shape
+    block: csc_matrix = compiled_model.jacobian_sparsity
+    offsets: npt.NDArray[np.intp] = np.arange(scenarios_amount)[:, np.newaxis]
+
+    result = solve_ivp(
+        fun=__calculate_model,
+        t_span=(times[0], times[-1]),
+        y0=initial_values.ravel(),
+        args=(
+            compiled_model,
+            variables.T,
+            (block.indices + compartments_amount * offsets).ravel(),
+            np.append(
+                (block.indptr[:-1] + block.nnz * offsets).ravel(),
+                block.nnz * scenarios_amount,
+            ),
+        ),
+        method=method.value,
+        **get_solver_arguments(times, options),
+        **(
+            {
+                "lband": compartments_amount - 1,
+                "uband": compartments_amount - 1,
+            }
+            if method is SolverMethod.LSODA
+            else {"jac": __calculate_jacobian}
+        ),
+    )
+
+    output_times: npt.NDArray[np.float64] = (
+        times if result.sol is not None else result.t
+    )
+    y: npt.NDArray[np.float64] = (
+        result.sol(times) if result.sol is not None else result.y
+    ).reshape(scenarios_amount, compartments_amount, -1)
+
+    if not y.min(initial=0) >= -1e-6:
+        scenario_index, compartment_index, time_index = np.argwhere(y < -1e-6)[0]
+
+        time: np.float64 = output_times[time_index]
+        name: str = list(model["compartments"])[compartment_index]
+
+        raise RuntimeError(
+            f"Negative value for {name} at time {time} in scenario {scenario_index + 1}"
+        )
+
+    return [
+        SeriesTable(output_times, y[scenario_index], list(model["compartments"]))
+        for scenario_index in range(scenarios_amount)
+    ]
+
+
+def __calculate_model(
+    t: np.float64,
+    y: npt.NDArray[np.float64],
+    compiled_model: CompiledModel,
+    variables: npt.NDArray[np.float64],
+    indices: npt.NDArray[np.intp],
+    indptr: npt.NDArray[np.intp],
+) -> npt.NDArray[np.float64]:
+    return compiled_model.calculate_batch(
+        y.reshape(variables.shape[1], -1).T, variables
+    ).T.ravel()
+
+
+def __calculate_jacobian(
+    t: np.float64,
+    y: npt.NDArray[np.float64],
+    compiled_model: CompiledModel,
+    variables: npt.NDArray[np.float64],
+    indices: npt.NDArray[np.intp],
+    indptr: npt.NDArray[np.intp],
+) -> csc_matrix:
+    return csc_matrix(
+        (
+            compiled_model.calculate_batch_jacobian_entries(
+                y.reshape(variables.shape[1], -1).T, variables
+            ).T.ravel(),
+            indices,
+            indptr,
+        ),
+        shape=(y.size, y.size),
+    )
@@ -0,0 +1,111 @@
+import numpy as np
+import numpy.typing as npt
+from scipy.integrate import solve_ivp
+from scipy.sparse import csc_matrix
+
+from classes.common.dense_solution import DenseSolution
+from classes.common.solver_method import SolverMethod
+from classes.common.solver_options import SolverOptions
+from classes.common.series_table import SeriesTable
+from classes.model.compiled_model import CompiledModel
+from classes.model.runtime_compartment import RuntimeCompartment
+from classes.model.runtime_model import RuntimeModel
+from classes.model.datatable import Datatable
+from classes.model.variables_evaluator import VariablesEvaluator
+from functions.get_solver_arguments import get_solver_arguments
+
+
+def simulate_sensitivities(
+    model: RuntimeModel,
+    compiled_model: CompiledModel,
+    constants: list[str],
+    times: npt.NDArray[np.float64],
+    variables_datatable: Datatable,
+    method: SolverMethod = SolverMethod.LSODA,
+    options: SolverOptions | None = None,
+) -> SeriesTable:
+    compartments_amount: int = len(model["compartments"])
+
+    result = solve_ivp(
+        fun=__calculate_model,
+        t_span=(times[0], times[-1]),
+        y0=[
+            *[compartment["value"] for compartment in model["compartments"].values()],
+            *[0] * (len(compiled_model.names) - compartments_amount),
+        ],
+        args=(
+            compiled_model,
+            variables_datatable.get_variables_evaluator(compiled_model.variables),
+        ),
+        method=method.value,
+        jac=(
+            __calculate_jacobian
+            if method is SolverMethod.LSODA
+            else __calculate_sparse_jacobian
+        ),
+        **get_solver_arguments(times, options),
+    )
+
+    if not all([y.min() >= -1e-6 for y in result.y[:compartments_amount]]):
+        compartment_index: int = next(
+            i for i, y in enumerate(result.y[:compartments_amount]) if y.min() < -1e-6
+        )
+        time_index: int = np.argmin(result.y[compartment_index]).item()
+
+        time: np.float64 = result.t[time_index]
+        compartment: RuntimeCompartment = list(model["compartments"].values())[
+            compartment_index
+        ]
+
+        raise RuntimeError(f"Negative value for {compartment["name"]} at time {time}")
+
+    variables_datatable.set_compartments(
+        SeriesTable(
+            result.t,
+            result.y[:compartments_amount],
+            list(model["compartments"]),
+            solution=(
+                DenseSolution(result.sol, np.arange(compartments_amount))
+                if result.sol is not None
+                else None
+            ),
+        )
+    )
+
+    return SeriesTable(
+        result.t,
+        result.y[compartments_amount:],
+        compiled_model.names[compartments_amount:],
+        solution=(
+            DenseSolution(result.sol, np.arange(compartments_amount, result.y.shape[0]))
+            if result.sol is not None
+            else None
+        ),
+    )
+
+
+def __calculate_model(
+    t: np.float64,
+    y: npt.NDArray[np.float64],
+    compiled_model: CompiledModel,
+    variables: VariablesEvaluator,
+) -> npt.NDArray[np.float64]:
+    return compiled_model.calculate(y, variables(t))
+
+
+def __calculate_jacobian(
+    t: np.float64,
+    y: npt.NDArray[np.float64],
+    compiled_model: CompiledModel,
+    variables: VariablesEvaluator,
+) -> npt.NDArray[np.float64]:
+    return compiled_model.calculate_jacobian(y, variables(t))
+
+
+def __calculate_sparse_jacobian(
+    t: np.float64,
+    y: npt.NDArray[np.float64],
+    compiled_model: CompiledModel,
+    variables: VariablesEvaluator,
+) -> csc_matrix:
+    return compiled_model.calculate_sparse_jacobian(y, variables(t))
@@ -0,0 +1,54 @@
+from typing import Any
+
+from classes.common.worker_pool import WorkerPool
+from classes.jobs.job import Job
+from classes.jobs.job_store import JobStore
+from classes.jobs.job_type import JobType
+from classes.model.model import Model
+from functions.get_job_store import get_job_store
+from functions.get_worker_pool import get_worker_pool
+from functions.run_in_thread import run_in_thread
+from functions.run_job import run_job
+from functions.run_multi_start import run_multi_start
+
+
+def submit_job(job_type: JobType, parameters: Any, model: Model) -> Job:
+    job_store: JobStore = get_job_store()
+    job: Job = job_store.create(job_type)
+
+    worker_pool: WorkerPool = get_worker_pool()
+
+    try:
+        job_store.attach(
+            job["id"],
+            (
+                run_in_thread(
+                    run_multi_start,
+                    worker_pool,
+                    parameters,
+                    model,
+                    None,
+                    job["id"],
+                    job_store.progress,
+                    job_store.cancellations,
+                )
+                if job_type is JobType.PARAMETERS_IDENTIFICATION
+                and "multiStart" in parameters
+                else worker_pool.submit(
+                    run_job,
+                    job_type,
+                    parameters,
+                    model,
+                    job["id"],
+                    job_store.progress,
+                    job_store.cancellations,
+                )
+            ),
+        )
+
+    except RuntimeError:
+        job_store.remove(job["id"])
+
+        raise
+
+    return job_store.get(job["id"]) or job
@@ -0,0 +1,17 @@
+import importlib
+
+WARM_UP_MODULES: list[str] = [
+    "sympy",
+    "middleware.validate_expression",
+    "scipy.integrate",
+    "scipy.optimize",
+    "middleware.simulation",
+    "middleware.batch_simulation",
+    "middleware.optimal_control",
+    "middleware.parameters_identification",
+]
+
+
+def warm_up_worker() -> None:
+    for module in WARM_UP_MODULES:
+        importlib.import_module(module)
@@ -1,57 +1,152 @@
+from multiprocessing import current_process
+from threading import Thread
+from typing import Any, Callable, TypeVar
 from flask import Flask, Response, jsonify, request
 from flask_cors import CORS
+from werkzeug.serving import is_running_from_reloader
 
 from classes.common.error_response import ErrorResponse
+from classes.common.json_provider import JSONProvider
+from classes.common.lazy_function import LazyFunction
+from classes.common.pool_cache_stats import PoolCacheStats
+from classes.jobs.job import Job
+from classes.jobs.job_type import JobType
+from classes.jobs.request_body import JobRequestBody
 from classes.optimal_control.request_body import OptimalControlRequestBody
 from classes.optimal_control.success_response import OptimalControlSuccessResponse
 from classes.parameters_identification.request_body import PIRequestBody
 from classes.parameters_identification.success_response import PISuccessResponse
+from classes.simulation.batch_request_body import BatchSimulationRequestBody
+from classes.simulation.batch_success_response import BatchSimulationSuccessResponse
 from classes.simulation.request_body import SimulationRequestBody
 from classes.simulation.success_response import SimulationSuccessResponse
+from classes.validate_expression.batch_validation_request_body import (
+    BatchValidationRequestBody,
+)
+from classes.validate_expression.batch_validation_response import (
+    BatchValidationResponse,
+)
 from classes.validate_expression.validation_request_body import ValidationRequestBody
 from classes.validate_expression.validation_response import ValidationResponse
-from middleware.optimal_control import optimal_control
-from middleware.parameters_identification import parameters_identification
-from middleware.simulation import simulation
-from middleware.validate_expression import validate_expression
+from functions.combine_cache_stats import combine_cache_stats
+from functions.encode_binary import BINARY_MIME_TYPE, encode_binary
+from functions.get_job_store import get_job_store
+from functions.get_worker_pool import get_worker_pool
+from functions.run_multi_start import run_multi_start
+from functions.share_times import SHARED_TIMES_MIME_TYPE, share_times
+from functions.submit_job import submit_job
+
+T = TypeVar("T")
+
+simulation: LazyFunction[SimulationSuccessResponse | ErrorResponse] = LazyFunction(
+    "middleware.simulation", "simulation"
+)
+batch_simulation: LazyFunction[BatchSimulationSuccessResponse | ErrorResponse] = (
+    LazyFunction("middleware.batch_simulation", "batch_simulation")
+)
+optimal_control: LazyFunction[OptimalControlSuccessResponse | ErrorResponse] = (
+    LazyFunction("middleware.optimal_control", "optimal_control")
+)
+parameters_identification: LazyFunction[PISuccessResponse | ErrorResponse] = (
+    LazyFunction("middleware.parameters_identification", "parameters_identification")
+)
+validate_expression: LazyFunction[ValidationResponse] = LazyFunction(
+    "middleware.validate_expression", "validate_expression"
+)
+validate_expressions: LazyFunction[BatchValidationResponse] = LazyFunction(
+    "middleware.validate_expressions", "validate_expressions"
+)
 
 app: Flask = Flask(__name__)
+app.json = JSONProvider(app)
 
 CORS(app)
 
+if current_process().name == "MainProcess" and (
+    __name__ != "__main__" or is_running_from_reloader()
+):
+    Thread(target=get_worker_pool().warm_up, daemon=True).start()
+
+
+def dispatch(function: Callable[..., T], *args: Any) -> T | ErrorResponse:
+    try:
+        return get_worker_pool().run(function, *args)
+
+    except RuntimeError as error:
+        return ErrorResponse(
+            {
+                "error": str(error),
+            }
+        )
+
+
+def respond(result: Any) -> Response:
+    mime_type: str | None = request.accept_mimetypes.best_match(
+        ["application/json", BINARY_MIME_TYPE, SHARED_TIMES_MIME_TYPE]
+    )
+
+    if mime_type == BINARY_MIME_TYPE:
+        return Response(encode_binary(result), mimetype=BINARY_MIME_TYPE)
+
+    if mime_type == SHARED_TIMES_MIME_TYPE:
+        return Response(
+            app.json.dumps(share_times(result)), mimetype=SHARED_TIMES_MIME_TYPE
+        )
+
+    return jsonify(result)
+
 
 @app.route("/simulate", methods=["POST"])
 def simulate_endpoint() -> Response:
     body: SimulationRequestBody = request.get_json()
 
-    result: SimulationSuccessResponse | ErrorResponse = simulation(
-        body["parameters"], body["model"]
+    result: SimulationSuccessResponse | ErrorResponse = dispatch(
+        simulation, body["parameters"], body["model"]
     )
 
-    return jsonify(result)
+    return respond(result)
+
+
+@app.route("/simulate/batch", methods=["POST"])
+def batch_simulate_endpoint() -> Response:
+    body: BatchSimulationRequestBody = request.get_json()
+
+    result: BatchSimulationSuccessResponse | ErrorResponse = dispatch(
+        batch_simulation, body["parameters"], body["model"]
+    )
+
+    return respond(result)
 
 
 @app.route("/optimal-control", methods=["POST"])
 def optimal_control_endpoint() -> Response:
     body: OptimalControlRequestBody = request.get_json()
 
-    result: OptimalControlSuccessResponse | ErrorResponse = optimal_control(
+    result: OptimalControlSuccessResponse | ErrorResponse = dispatch(
+        optimal_control,
         body["parameters"],
         body["model"],
     )
 
-    return jsonify(result)
+    return respond(result)
 
 
 @app.route("/parameters-identification", methods=["POST"])
 def parameters_identification_endpoint():
     body: PIRequestBody = request.get_json()
 
-    result: PISuccessResponse | ErrorResponse = parameters_identification(
-        body["parameters"], body["model"]
+    result: PISuccessResponse | ErrorResponse = (
+        run_multi_start(
+            get_worker_pool(),
+            body["parameters"],
+            body["model"],
+            get_worker_pool().timeout,
+        )
+        if "multiStart" in body["parameters"]
+        else dispatch(parameters_identification, body["parameters"], body["model"])
     )
 
-    return jsonify(result)
+    return respond(result)
 
 
 @app.route("/validate-expression", methods=["POST"])
@@ -65,5 +160,59 @@ def validate_expression_endpoint() -> Response:
     return jsonify(result)
 
 
+@app.route("/validate-expressions", methods=["POST"])
+def validate_expressions_endpoint() -> Response:
+    body: BatchValidationRequestBody = request.get_json()
+
+    result: BatchValidationResponse = validate_expressions(
+        body["expressions"], body["allowedSymbols"]
+    )
+
+    return jsonify(result)
+
+
+@app.route("/jobs/<job_type>", methods=["POST"])
+def create_job_endpoint(job_type: str) -> Response | tuple[Response, int]:
+    if job_type not in [job_type.value for job_type in JobType]:
+        return jsonify(ErrorResponse({"error": "Unknown job type"})), 404
+
+    body: JobRequestBody = request.get_json()
+
+    try:
+        result: Job = submit_job(JobType(job_type), body["parameters"], body["model"])
+
+    except RuntimeError as error:
+        return jsonify(ErrorResponse({"error": str(error)})), 503
+
+    return jsonify(result), 202
+
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def get_job_endpoint(job_id: str) -> Response | tuple[Response, int]:
+    result: Job | None = get_job_store().get(job_id)
+
+    if result is None:
+        return jsonify(ErrorResponse({"error": "Job not found"})), 404
+
+    return respond(result)
+
+
+@app.route("/jobs/<job_id>", methods=["DELETE"])
+def cancel_job_endpoint(job_id: str) -> Response | tuple[Response, int]:
+    result: Job | None = get_job_store().cancel(job_id)
+
+    if result is None:
+        return jsonify(ErrorResponse({"error": "Job not found"})), 404
+
+    return jsonify(result)
+
+
+@app.route("/model-cache", methods=["GET"])
+def model_cache_endpoint() -> Response:
+    result: PoolCacheStats = combine_cache_stats(get_worker_pool().get_reports())
+
+    return jsonify(result)
+
+
 if __name__ == "__main__":
     app.run(debug=True)
@@ -0,0 +1,179 @@
+import json
+import numpy as np
+import numpy.typing as npt
+
+from classes.common.error_response import ErrorResponse
+from classes.common.series_table import SeriesTable
+from classes.common.solver_method import SolverMethod
+from classes.model.compiled_model import CompiledModel
+from classes.model.datatable import Datatable
+from classes.model.model import Model
+from classes.model.model_cache_entry import ModelCacheEntry
+from classes.model.runtime_model import RuntimeModel
+from classes.simulation.batch_parameters import BatchSimulationParameters
+from classes.simulation.batch_success_response import BatchSimulationSuccessResponse
+from classes.simulation.result import SimulationResult
+from classes.simulation.scenario import SimulationScenario
+from functions.model_cache import get_cached_model, validate_cached
+from functions.parse_enum import parse_enum
+from functions.simulate import simulate
+from functions.simulate_batch import simulate_batch
+from middleware.simulation import get_variables_datatable, validate_model
+
+
+def batch_simulation(
+    parameters: BatchSimulationParameters, model: Model
+) -> BatchSimulationSuccessResponse | ErrorResponse:
+    try:
+        method: SolverMethod = parse_enum(
+            SolverMethod, parameters.get("method", SolverMethod.LSODA), "solver method"
+        )
+        cached_model: ModelCacheEntry = get_cached_model(model)
+        runtime_model: RuntimeModel = cached_model["runtime_model"]
+        compiled_model: CompiledModel = cached_model["compiled_model"]
+
+        scenario_models: list[RuntimeModel] = [
+            apply_scenario(runtime_model, scenario)
+            for scenario in parameters["scenarios"]
+        ]
+
+        for scenario_model in scenario_models:
+            validate_cached(
+                cached_model,
+                json.dumps(["simulation", scenario_model["constants"]], sort_keys=True),
+                lambda: validate_model(scenario_model),
+            )
+
+        times: npt.NDArray[np.float64] = np.linspace(
+            0,
+            parameters["time"],
+            parameters["nodesAmount"] + 1,
+            dtype=np.float64,
+        )
+        results: list[SimulationResult] = []
+
+        if parameters.get("vectorized", False) and len(scenario_models):
+            scenarios_compartments: list[SeriesTable] = simulate_batch(
+                runtime_model,
+                compiled_model,
+                times,
+                np.array(
+                    [
+                        [
+                            compartment["value"]
+                            for compartment in scenario_model["compartments"].values()
+                        ]
+                        for scenario_model in scenario_models
+                    ],
+                    dtype=np.float64,
+                ),
+                np.array(
+                    [
+                        [
+                            get_scenario_variables(scenario_model)[variable]
+                            for variable in compiled_model.variables
+                        ]
+                        for scenario_model in scenario_models
+                    ],
+                    dtype=np.float64,
+                ),
+                method,
+                parameters.get("solver"),
+            )
+
+            for compartments in scenarios_compartments:
+                results.append(
+                    {"compartments": compartments.get_data(parameters.get("maxPoints"))}
+                )
+
+        else:
+            for scenario_model in scenario_models:
+                variables_datatable: Datatable = get_variables_datatable(
+                    scenario_model, times
+                )
+
+                simulate(
+                    scenario_model,
+                    compiled_model,
+                    times,
+                    variables_datatable,
+                    method,
+                    parameters.get("solver"),
+                )
+
+                results.append(
+                    {
+                        "compartments": variables_datatable.compartments.resample(
+                            times
+                        ).get_data(parameters.get("maxPoints"))
+                    }
+                )
+
+        return {
+            "type": "BatchSimulation",
+            "parameters": parameters,
+            "model": model,
+            "result": {
+                "scenarios": results,
+            },
+        }
+
+    except RuntimeError as error:
+        return ErrorResponse(
+            {
+                "error": str(error),
+            }
+        )
+
+    except Exception as error:
+        print(error)
+
+        return ErrorResponse(
+            {
+                "error": "There is an error in the back end",
+            }
+        )
+
+
+def apply_scenario(
+    runtime_model: RuntimeModel, scenario: SimulationScenario
+) -> RuntimeModel:
+    constants: dict[str, float] = scenario.get("constants", {})
+    compartments: dict[str, float] = scenario.get("compartments", {})
+
+    unknown_variables: list[str] = [
+        *[
+            name
+            for name in constants
+            if name not in [constant["name"] for constant in runtime_model["constants"]]
+        ],
+        *[name for name in compartments if name not in runtime_model["compartments"]],
+    ]
+
+    if len(unknown_variables):
+        raise RuntimeError(
+            "Scenario contains variables that are not known to the model: "
+            + ", ".join(f'"{variable}"' for variable in unknown_variables)
+        )
+
+    return {
+        **runtime_model,
+        "constants": [
+            {**constant, "value": constants.get(constant["name"], constant["value"])}
+            for constant in runtime_model["constants"]
+        ],
+        "compartments": {
+            name: {**compartment, "value": compartments.get(name, compartment["value"])}
+            for name, compartment in runtime_model["compartments"].items()
+        },
+    }
+
+
+def get_scenario_variables(scenario_model: RuntimeModel) -> dict[str, float]:
+    return {
+        **{
+            constant["name"]: constant["value"]
+            for constant in scenario_model["constants"]
+        },
+        **{intervention["name"]: 0 for intervention in scenario_model["interventions"]},
+    }
@@ -1,67 +1,110 @@
+import json
+import time
 import numpy as np
 import numpy.typing as npt
 import sympy as sp
+from scipy.optimize import minimize
+from scipy.sparse import csc_matrix
 
 from classes.common.data import Data
 from classes.common.error_response import ErrorResponse
+from classes.common.series_table import SeriesTable
+from classes.common.solver_method import SolverMethod
 from classes.common.values import Values
+from classes.model.compiled_model import CompiledModel
 from classes.model.continuity_type import ContinuityType
 from classes.model.equation import Equation
+from classes.model.model_cache_entry import ModelCacheEntry
 from classes.model.runtime_compartment import RuntimeCompartment
 from classes.model.runtime_model import RuntimeModel
 from classes.model.datatable import Datatable
 from classes.model.model import Model
 from classes.common.interpolation_type import InterpolationType
+from classes.jobs.progress_callback import ProgressCallback
+from classes.optimal_control.algorithm import OptimalControlAlgorithm
 from classes.optimal_control.intervention_boundaries import InterventionBoundaries
 from classes.optimal_control.intervention_parameters import InterventionParameters
+from classes.optimal_control.intervention_update import InterventionUpdate
 from classes.optimal_control.parameters import OptimalControlParameters
+from classes.optimal_control.problem import OptimalControlProblem
 from classes.optimal_control.result import OptimalControlResult
 from classes.optimal_control.success_response import OptimalControlSuccessResponse
+from classes.optimal_control.iteration import OptimalControlIteration
+from classes.optimal_control.sweep_parameters import SweepParameters
 from classes.optimal_control.adjoint_model import AdjointModel
+from functions.get_quadrature import get_quadrature
 from functions.is_population_preserved import is_population_preserved
-from functions.model_to_runtime_model import model_to_runtime_model
+from functions.model_cache import (
+    get_cached_interventions,
+    get_cached_model,
+    get_cached_optimal_control_problem,
+    set_cached_interventions,
+    validate_cached,
+)
+from functions.parse_enum import parse_enum
 from functions.simulate import simulate
 from functions.simulate_adjoint import simulate_adjoint
 
+MAX_ITERATIONS: int = int(1e2)
+TOLERANCE: float = 1e-4
+RELAXATION: float = 0.5
+RELAXATION_GROWTH: float = 1.5
+MIN_RELAXATION: float = 1 / 16
+ANDERSON_DEPTH: int = 5
+
 
 def optimal_control(
-    parameters: OptimalControlParameters, model: Model
+    parameters: OptimalControlParameters,
+    model: Model,
+    progress: ProgressCallback | None = None,
 ) -> OptimalControlSuccessResponse | ErrorResponse:
     try:
-        runtime_model: RuntimeModel = model_to_runtime_model(model)
-        cost_function: Equation = get_cost_function(
-            parameters["objectiveFunction"],
-            [
-                *[compartment for compartment in runtime_model["compartments"]],
-                *[constant["name"] for constant in runtime_model["constants"]],
-                *[
-                    intervention["name"]
-                    for intervention in runtime_model["interventions"]
-                ],
-            ],
+        method: SolverMethod = parse_enum(
+            SolverMethod, parameters.get("method", SolverMethod.LSODA), "solver method"
         )
-
-        validate_model(runtime_model, parameters["intervention"]["boundaries"])
-        validate_cost_function(
-            cost_function, runtime_model, parameters["intervention"]["boundaries"]
+        algorithm: OptimalControlAlgorithm = parse_enum(
+            OptimalControlAlgorithm,
+            parameters.get("algorithm", OptimalControlAlgorithm.SWEEP),
+            "optimal control algorithm",
         )
 
-        hamiltonian: Equation = get_hamiltonian(
-            cost_function, runtime_model["compartments"]
+        parse_enum(
+            InterpolationType,
+            parameters["intervention"]["interpolationType"],
+            "interpolation type",
         )
-        adjoint_model: AdjointModel = hamiltonian_to_adjoint_model(
-            hamiltonian, list(runtime_model["compartments"].keys())
+
+        cached_model: ModelCacheEntry = get_cached_model(model)
+        runtime_model: RuntimeModel = cached_model["runtime_model"]
+        compiled_model: CompiledModel = cached_model["compiled_model"]
+        problem: OptimalControlProblem = get_cached_optimal_control_problem(
+            cached_model,
+            parameters["objectiveFunction"],
+            lambda: get_problem(runtime_model, parameters["objectiveFunction"]),
         )
-        hamiltonian_intervention_partials: dict[str, Equation] = (
-            get_hamiltonian_intervention_partials(
-                hamiltonian,
+        cost_function: Equation = problem["cost_function"]
+
+        validate_cached(
+            cached_model,
+            json.dumps(
                 [
-                    intervention["name"]
-                    for intervention in runtime_model["interventions"]
+                    "optimal-control",
+                    runtime_model["constants"],
+                    parameters["intervention"]["boundaries"],
+                    parameters["objectiveFunction"],
                 ],
-            )
+                sort_keys=True,
+            ),
+            lambda: validate_problem(
+                cost_function,
+                runtime_model,
+                parameters["intervention"]["boundaries"],
+            ),
         )
 
+        hamiltonian: Equation = problem["hamiltonian"]
+        adjoint_model: AdjointModel = problem["adjoint_model"]
+
         times: npt.NDArray[np.float64] = np.linspace(
             0,
             parameters["time"],
@@ -78,70 +121,117 @@ def optimal_control(
 
         variables_datatable.set_constants(
             {
-                constant["name"]: Values(
-                    times,
-                    np.repeat(constant["value"], times.size),
-                    InterpolationType.PIECEWISE_CONSTANT,
-                )
+                constant["name"]: constant["value"]
                 for constant in runtime_model["constants"]
             }
         )
         variables_datatable.set_interventions(
-            {
-                intervention["name"]: Values(
-                    intervention_times,
-                    np.zeros(intervention_times.size),
-                    InterpolationType.PIECEWISE_CONSTANT,
-                )
-                for intervention in runtime_model["interventions"]
-            }
+            SeriesTable(
+                intervention_times,
+                np.zeros(
+                    (len(runtime_model["interventions"]), intervention_times.size)
+                ),
+                [
+                    intervention["name"]
+                    for intervention in runtime_model["interventions"]
+                ],
+                InterpolationType.PIECEWISE_CONSTANT,
+            )
         )
 
-        simulate(runtime_model, times, variables_datatable)
+        simulate(
+            runtime_model,
+            compiled_model,
+            times,
+            variables_datatable,
+            method,
+            parameters.get("solver"),
+            dense=True,
+        )
 
         no_control_cost: np.float64 = cost_function.calculate_interval(
             times, variables_datatable
         )
-        no_control_compartments: dict[str, Data] = variables_datatable.compartments_data
-
-        optimal_cost: np.float64 = no_control_cost
-        previous_interventions: dict[str, Values] = {}
-        current_interventions: dict[str, Values] = variables_datatable.interventions
-
-        for _ in range(int(1e2)):
-            simulate_adjoint(adjoint_model, intervention_times, variables_datatable)
+        no_control_compartments: dict[str, Data] = (
+            variables_datatable.compartments.resample(times).get_data(
+                parameters.get("maxPoints")
+            )
+        )
 
-            update_interventions(
-                hamiltonian_intervention_partials,
+        warm_start_key: str = json.dumps(
+            [
+                "optimal-control",
+                runtime_model["constants"],
+                parameters["intervention"]["boundaries"],
+                parameters["objectiveFunction"],
+                parameters["time"],
+            ],
+            sort_keys=True,
+        )
+        warm_start: SeriesTable | None = (
+            get_cached_interventions(cached_model, warm_start_key)
+            if parameters.get("sweep", {}).get("warmStart", False)
+            else None
+        )
+        interventions: npt.NDArray[np.float64] = (
+            get_warm_start_interventions(warm_start, intervention_times, runtime_model)
+            if warm_start is not None
+            else variables_datatable.interventions.values
+        )
+        optimal_cost: np.float64 = (
+            evaluate_interventions(
+                interventions,
+                runtime_model,
+                compiled_model,
+                cost_function,
+                times,
                 intervention_times,
-                parameters["intervention"],
+                parameters,
                 variables_datatable,
+                method,
             )
+            if warm_start is not None
+            else no_control_cost
+        )
 
-            simulate(runtime_model, times, variables_datatable)
+        if algorithm is OptimalControlAlgorithm.DIRECT:
+            optimal_cost, iterations = optimize_directly(
+                problem,
+                runtime_model,
+                compiled_model,
+                times,
+                intervention_times,
+                parameters,
+                variables_datatable,
+                method,
+                interventions,
+                progress,
+            )
 
-            optimal_cost = cost_function.calculate_interval(times, variables_datatable)
-            previous_interventions = current_interventions
-            current_interventions = variables_datatable.interventions
+        else:
+            optimal_cost, iterations = sweep(
+                problem,
+                runtime_model,
+                compiled_model,
+                times,
+                intervention_times,
+                parameters,
+                variables_datatable,
+                method,
+                interventions,
+                optimal_cost,
+                progress,
+            )
 
-            if (
-                np.max(
-                    [
-                        np.linalg.norm(
-                            current_interventions[intervention].values
-                            - previous_interventions[intervention].values,
-                            ord=2,
-                        )
-                        for intervention in current_interventions
-                    ]
-                )
-                < 1e-4
-            ):
-                break
+        set_cached_interventions(
+            cached_model, warm_start_key, variables_datatable.interventions
+        )
 
         result: OptimalControlResult = {
             "noControlCompartments": no_control_compartments,
-            "optimalCompartments": variables_datatable.compartments_data,
+            "optimalCompartments": variables_datatable.compartments.resample(
+                times
+            ).get_data(parameters.get("maxPoints")),
             "interventions": variables_datatable.interventions_data,
             "hamiltonian": str(hamiltonian.expression),
             "adjointModel": {
@@ -150,6 +240,8 @@ def optimal_control(
             },
             "noControlObjective": no_control_cost,
             "optimalObjective": optimal_cost,
+            "iterations": iterations,
+            "warmStarted": warm_start is not None,
         }
 
         return {
@@ -176,66 +268,457 @@ def optimal_control(
         )
 
 
-def update_interventions(
-    hamiltonian_intervention_partials: dict[str, Equation],
+def sweep(
+    problem: OptimalControlProblem,
+    runtime_model: RuntimeModel,
+    compiled_model: CompiledModel,
     times: npt.NDArray[np.float64],
-    intervention_parameters: InterventionParameters,
+    intervention_times: npt.NDArray[np.float64],
+    parameters: OptimalControlParameters,
     variables_datatable: Datatable,
-) -> None:
-    ETA = 0.5
-
-    new_values: dict[str, Values] = {}
+    method: SolverMethod,
+    interventions: npt.NDArray[np.float64],
+    optimal_cost: np.float64,
+    progress: ProgressCallback | None = None,
+) -> tuple[np.float64, list[OptimalControlIteration]]:
+    sweep_parameters: SweepParameters = parameters.get("sweep", {})
+    max_iterations: int = sweep_parameters.get("maxIterations", MAX_ITERATIONS)
+    lower_boundaries, upper_boundaries = get_intervention_boundaries(
+        [intervention["name"] for intervention in runtime_model["interventions"]],
+        parameters["intervention"],
+    )
+    relaxation: float = RELAXATION
+    history: list[tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]] = []
+    iterations: list[OptimalControlIteration] = []
+
+    for iteration in range(max_iterations):
+        if progress is not None:
+            progress(iteration, max_iterations)
+
+        iteration_start: float = time.perf_counter()
+
+        simulate_adjoint(
+            problem["compiled_adjoint_model"],
+            intervention_times,
+            variables_datatable,
+            method,
+            parameters.get("solver"),
+            dense=True,
+        )
 
-    for intervention_name, equation in hamiltonian_intervention_partials.items():
-        boundaries: InterventionBoundaries = intervention_parameters["boundaries"][
-            intervention_name
+        residual: npt.NDArray[np.float64] = (
+            get_intervention_targets(
+                problem["intervention_updates"],
+                runtime_model,
+                intervention_times,
+                parameters["intervention"],
+                variables_datatable,
+            )
+            - interventions
+        )
+        history = [*history[-ANDERSON_DEPTH:], (interventions, residual)]
+        candidates: list[tuple[npt.NDArray[np.float64], float, bool]] = [
+            (interventions + step * residual, step, False)
+            for step in get_relaxation_steps(relaxation)
         ]
 
-        update_solution: list[sp.Expr] = sp.solve(
-            equation.expression, intervention_name
+        if sweep_parameters.get("acceleration", True) and len(history) > 1:
+            candidates.insert(
+                0,
+                (
+                    np.clip(
+                        get_anderson_step(history),
+                        lower_boundaries,
+                        upper_boundaries,
+                    ),
+                    1.0,
+                    True,
+                ),
+            )
+
+        accepted_interventions: SeriesTable = variables_datatable.interventions
+        accepted_compartments: SeriesTable = variables_datatable.compartments
+        improved: bool = False
+
+        for solves, (candidate, step, accelerated) in enumerate(candidates, 1):
+            candidate_cost: np.float64 = evaluate_interventions(
+                candidate,
+                runtime_model,
+                compiled_model,
+                problem["cost_function"],
+                times,
+                intervention_times,
+                parameters,
+                variables_datatable,
+                method,
+            )
+
+            if candidate_cost <= optimal_cost:
+                improved = True
+
+                break
+
+        if not improved:
+            variables_datatable.set_interventions(accepted_interventions)
+            variables_datatable.set_compartments(accepted_compartments)
+
+            candidate, candidate_cost, step = interventions, optimal_cost, 0.0
+
+        elif not accelerated:
+            relaxation = (
+                min(step * RELAXATION_GROWTH, 1.0) if step == relaxation else step
+            )
+
+        change: np.float64 = np.max(
+            np.linalg.norm(candidate - interventions, ord=2, axis=1), initial=0
+        )
+        interventions, optimal_cost = candidate, candidate_cost
+
+        iterations.append(
+            {
+                "objective": float(optimal_cost),
+                "relaxation": step,
+                "accelerated": accelerated,
+                "forwardSolves": solves,
+                "duration": time.perf_counter() - iteration_start,
+            }
         )
 
-        if len(update_solution):
-            update_equation: Equation = Equation()
+        if not improved or change < sweep_parameters.get("tolerance", TOLERANCE):
+            break
+
+    return optimal_cost, iterations
 
-            update_equation.add(update_solution[0])
 
-            updated_values: npt.NDArray[np.float64] = np.clip(
-                update_equation.calculate(
+def optimize_directly(
+    problem: OptimalControlProblem,
+    runtime_model: RuntimeModel,
+    compiled_model: CompiledModel,
+    times: npt.NDArray[np.float64],
+    intervention_times: npt.NDArray[np.float64],
+    parameters: OptimalControlParameters,
+    variables_datatable: Datatable,
+    method: SolverMethod,
+    interventions: npt.NDArray[np.float64],
+    progress: ProgressCallback | None = None,
+) -> tuple[np.float64, list[OptimalControlIteration]]:
+    lower_boundaries, upper_boundaries = get_intervention_boundaries(
+        [intervention["name"] for intervention in runtime_model["interventions"]],
+        parameters["intervention"],
+    )
+    quadrature_points, quadrature_weights = get_quadrature(
+        np.union1d(times, intervention_times)
+    )
+    costs: list[float] = []
+    iterations: list[OptimalControlIteration] = []
+    start: float = time.perf_counter()
+
+    minimize_result = minimize(
+        direct_criteria,
+        interventions.ravel(),
+        args=(
+            interventions.shape,
+            problem,
+            runtime_model,
+            compiled_model,
+            times,
+            intervention_times,
+            parameters,
+            variables_datatable,
+            method,
+            quadrature_points,
+            Values(
+                intervention_times,
+                np.zeros(intervention_times.size),
+                parameters["intervention"]["interpolationType"],
+            )
+            .get_weights(quadrature_points)
+            .multiply(quadrature_weights[:, np.newaxis])
+            .tocsc(),
+            costs,
+        ),
+        jac=True,
+        bounds=np.column_stack(
+            [
+                np.broadcast_to(lower_boundaries, interventions.shape).ravel(),
+                np.broadcast_to(upper_boundaries, interventions.shape).ravel(),
+            ]
+        ),
+        method="L-BFGS-B",
+        options={"maxiter": MAX_ITERATIONS},
+        callback=lambda _: record_direct_iteration(iterations, costs, start, progress),
+    )
+
+    return (
+        evaluate_interventions(
+            minimize_result.x.reshape(interventions.shape),
+            runtime_model,
+            compiled_model,
+            problem["cost_function"],
+            times,
+            intervention_times,
+            parameters,
+            variables_datatable,
+            method,
+        ),
+        iterations,
+    )
+
+
+def direct_criteria(
+    values: npt.NDArray[np.float64],
+    shape: tuple[int, int],
+    problem: OptimalControlProblem,
+    runtime_model: RuntimeModel,
+    compiled_model: CompiledModel,
+    times: npt.NDArray[np.float64],
+    intervention_times: npt.NDArray[np.float64],
+    parameters: OptimalControlParameters,
+    variables_datatable: Datatable,
+    method: SolverMethod,
+    quadrature_points: npt.NDArray[np.float64],
+    weights: csc_matrix,
+    costs: list[float],
+) -> tuple[float, npt.NDArray[np.float64]]:
+    cost: np.float64 = evaluate_interventions(
+        values.reshape(shape),
+        runtime_model,
+        compiled_model,
+        problem["cost_function"],
+        times,
+        intervention_times,
+        parameters,
+        variables_datatable,
+        method,
+    )
+
+    simulate_adjoint(
+        problem["compiled_adjoint_model"],
+        times,
+        variables_datatable,
+        method,
+        parameters.get("solver"),
+        dense=True,
+    )
+
+    partials: npt.NDArray[np.float64] = np.array(
+        [
+            np.broadcast_to(
+                partial.calculate(
                     [
-                        variables_datatable[variable.name](times)
-                        for variable in update_equation.variables
+                        variables_datatable[variable.name](quadrature_points)
+                        for variable in partial.variables
                     ]
                 ),
-                boundaries["lowerBoundary"],
-                boundaries["upperBoundary"],
+                quadrature_points.shape,
             )
+            for partial in [
+                problem["intervention_partials"][intervention["name"]]
+                for intervention in runtime_model["interventions"]
+            ]
+        ],
+        dtype=np.float64,
+    ).reshape(-1, quadrature_points.size)
 
-            new_values[intervention_name] = Values(
-                times,
-                ETA * updated_values
-                + (1 - ETA) * variables_datatable[intervention_name](times),
-                intervention_parameters["interpolationType"],
+    costs.append(float(cost))
+
+    return float(cost), (weights.T @ partials.T).T.ravel()
+
+
+def record_direct_iteration(
+    iterations: list[OptimalControlIteration],
+    costs: list[float],
+    start: float,
+    progress: ProgressCallback | None = None,
+) -> None:
+    iterations.append(
+        {
+            "objective": costs[-1],
+            "forwardSolves": len(costs)
+            - sum(iteration["forwardSolves"] for iteration in iterations),
+            "duration": time.perf_counter()
+            - start
+            - sum(iteration["duration"] for iteration in iterations),
+        }
+    )
+
+    if progress is not None:
+        progress(len(iterations), MAX_ITERATIONS)
+
+
+def evaluate_interventions(
+    interventions: npt.NDArray[np.float64],
+    runtime_model: RuntimeModel,
+    compiled_model: CompiledModel,
+    cost_function: Equation,
+    times: npt.NDArray[np.float64],
+    intervention_times: npt.NDArray[np.float64],
+    parameters: OptimalControlParameters,
+    variables_datatable: Datatable,
+    method: SolverMethod,
+) -> np.float64:
+    variables_datatable.set_interventions(
+        SeriesTable(
+            intervention_times,
+            interventions,
+            [intervention["name"] for intervention in runtime_model["interventions"]],
+            parameters["intervention"]["interpolationType"],
+        )
+    )
+
+    simulate(
+        runtime_model,
+        compiled_model,
+        times,
+        variables_datatable,
+        method,
+        parameters.get("solver"),
+        dense=True,
+    )
+
+    return cost_function.calculate_interval(times, variables_datatable)
+
+
+def get_intervention_targets(
+    intervention_updates: dict[str, InterventionUpdate],
+    runtime_model: RuntimeModel,
+    times: npt.NDArray[np.float64],
+    intervention_parameters: InterventionParameters,
+    variables_datatable: Datatable,
+) -> npt.NDArray[np.float64]:
+    targets: npt.NDArray[np.float64] = np.empty(
+        (len(runtime_model["interventions"]), times.size), dtype=np.float64
+    )
+
+    for i, intervention in enumerate(runtime_model["interventions"]):
+        intervention_name: str = intervention["name"]
+        update: InterventionUpdate = intervention_updates[intervention_name]
+        boundaries: InterventionBoundaries = intervention_parameters["boundaries"][
+            intervention_name
+        ]
+        values: npt.NDArray[np.float64] = update["equation"].calculate(
+            [
+                variables_datatable[variable.name](times)
+                for variable in update["equation"].variables
+            ]
+        )
+
+        targets[i] = (
+            np.where(
+                values > 0,
+                boundaries["lowerBoundary"],
+                boundaries["upperBoundary"],
             )
-        else:
-            derivative_values = equation.calculate(
-                [
-                    variables_datatable[variable.name](times)
-                    for variable in equation.variables
-                ]
+            if update["bang_bang"]
+            else np.clip(
+                values,
+                boundaries["lowerBoundary"],
+                boundaries["upperBoundary"],
             )
+        )
+
+    return targets
+
+
+def get_warm_start_interventions(
+    warm_start: SeriesTable,
+    times: npt.NDArray[np.float64],
+    runtime_model: RuntimeModel,
+) -> npt.NDArray[np.float64]:
+    resampled: SeriesTable = warm_start.resample(times)
+
+    return resampled.values[
+        [
+            resampled.indexes[intervention["name"]]
+            for intervention in runtime_model["interventions"]
+        ]
+    ]
+
+
+def get_intervention_boundaries(
+    interventions: list[str], intervention_parameters: InterventionParameters
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    boundaries: list[InterventionBoundaries] = [
+        intervention_parameters["boundaries"][intervention]
+        for intervention in interventions
+    ]
+
+    return np.array(
+        [[boundary["lowerBoundary"]] for boundary in boundaries], dtype=np.float64
+    ), np.array(
+        [[boundary["upperBoundary"]] for boundary in boundaries], dtype=np.float64
+    )
 
-            new_values[intervention_name] = Values(
-                times,
-                np.where(
-                    derivative_values > 0,
-                    boundaries["lowerBoundary"],
-                    boundaries["upperBoundary"],
-                ),
-                intervention_parameters["interpolationType"],
-            )
 
-    variables_datatable.set_interventions(new_values)
+def get_relaxation_steps(relaxation: float) -> list[float]:
+    steps: list[float] = [relaxation]
+
+    while steps[-1] / 2 >= MIN_RELAXATION:
+        steps.append(steps[-1] / 2)
+
+    return steps
+
+
+def get_anderson_step(
+    history: list[tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]],
+) -> npt.NDArray[np.float64]:
+    interventions, residual = history[-1]
+    interventions_differences: npt.NDArray[np.float64] = np.array(
+        [(history[i + 1][0] - history[i][0]).ravel() for i in range(len(history) - 1)]
+    ).T
+    residuals_differences: npt.NDArray[np.float64] = np.array(
+        [(history[i + 1][1] - history[i][1]).ravel() for i in range(len(history) - 1)]
+    ).T
+    coefficients: npt.NDArray[np.float64] = np.linalg.lstsq(
+        residuals_differences, residual.ravel(), rcond=None
+    )[0]
+
+    return (
+        interventions.ravel()
+        + residual.ravel()
+        - (interventions_differences + residuals_differences) @ coefficients
+    ).reshape(interventions.shape)
+
+
+def get_problem(
+    runtime_model: RuntimeModel, objective_function: str
+) -> OptimalControlProblem:
+    cost_function: Equation = get_cost_function(
+        objective_function,
+        [
+            *[compartment for compartment in runtime_model["compartments"]],
+            *[constant["name"] for constant in runtime_model["constants"]],
+            *[intervention["name"] for intervention in runtime_model["interventions"]],
+        ],
+    )
+    hamiltonian: Equation = get_hamiltonian(
+        cost_function, runtime_model["compartments"]
+    )
+    adjoint_model: AdjointModel = hamiltonian_to_adjoint_model(
+        hamiltonian, list(runtime_model["compartments"].keys())
+    )
+    intervention_partials: dict[str, Equation] = get_hamiltonian_intervention_partials(
+        hamiltonian,
+        [intervention["name"] for intervention in runtime_model["interventions"]],
+    )
+
+    return {
+        "cost_function": cost_function,
+        "hamiltonian": hamiltonian,
+        "adjoint_model": adjoint_model,
+        "compiled_adjoint_model": CompiledModel(adjoint_model["lambdas"]),
+        "intervention_partials": intervention_partials,
+        "intervention_updates": get_intervention_updates(intervention_partials),
+    }
+
+
+def validate_problem(
+    cost_function: Equation,
+    runtime_model: RuntimeModel,
+    intervention_boundaries: dict[str, InterventionBoundaries],
+) -> None:
+    validate_model(runtime_model, intervention_boundaries)
+    validate_cost_function(cost_function, runtime_model, intervention_boundaries)
 
 
 def validate_model(
@@ -445,10 +928,31 @@ def get_hamiltonian_intervention_partials(
 
     for intervention in interventions:
         symbol: sp.Symbol = sp.Symbol(intervention)
-        equation: Equation = Equation()
+        equation: Equation = Equation(cse=True)
 
         equation.add(hamiltonian.expression.diff(symbol))
 
         partials[symbol.name] = equation
 
     return partials
+
+
+def get_intervention_updates(
+    intervention_partials: dict[str, Equation],
+) -> dict[str, InterventionUpdate]:
+    updates: dict[str, InterventionUpdate] = {}
+
+    for intervention, partial in intervention_partials.items():
+        solution: list[sp.Expr] = sp.solve(partial.expression, intervention)
+
+        if len(solution):
+            equation: Equation = Equation(cse=True)
+
+            equation.add(solution[0])
+
+            updates[intervention] = {"equation": equation, "bang_bang": False}
+
+        else:
+            updates[intervention] = {"equation": partial, "bang_bang": True}
+
+    return updates
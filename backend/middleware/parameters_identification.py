@@ -1,98 +1,135 @@
+from functools import partial
+from itertools import count
+import json
+import warnings
 import numpy as np
 import numpy.typing as npt
 import sympy as sp
 from scipy.optimize import minimize
+from scipy.stats import qmc
 
 from classes.common.interpolation_type import InterpolationType
 from classes.common.data import Data
 from classes.common.error_response import ErrorResponse
-from classes.common.values import Values
+from classes.common.series_table import SeriesTable
+from classes.common.solver_method import SolverMethod
+from classes.jobs.progress_callback import ProgressCallback
+from classes.model.compiled_model import CompiledModel
 from classes.model.continuity_type import ContinuityType
 from classes.model.datatable import Datatable
 from classes.model.model import Model
+from classes.model.model_cache_entry import ModelCacheEntry
 from classes.model.runtime_model import RuntimeModel
+from classes.parameters_identification.local_optimum import LocalOptimum
+from classes.parameters_identification.multi_start_parameters import (
+    MultiStartParameters,
+)
 from classes.parameters_identification.parameters import PIParameters
+from classes.parameters_identification.result import PIResult
+from classes.parameters_identification.sampling_method import SamplingMethod
 from classes.parameters_identification.selected_constant import SelectedConstant
 from classes.parameters_identification.success_response import PISuccessResponse
+from functions.compile_sensitivity_model import get_sensitivity_name
 from functions.is_population_preserved import is_population_preserved
-from functions.model_to_runtime_model import model_to_runtime_model
+from functions.model_cache import (
+    get_cached_model,
+    get_cached_sensitivity_model,
+    validate_cached,
+)
+from functions.parse_enum import parse_enum
 from functions.simulate import simulate
+from functions.simulate_sensitivities import simulate_sensitivities
+
+MAX_ITERATIONS: int = 15000
 
 
 def parameters_identification(
-    parameters: PIParameters, model: Model
+    parameters: PIParameters,
+    model: Model,
+    progress: ProgressCallback | None = None,
+    local_optima: list[LocalOptimum] | None = None,
 ) -> PISuccessResponse | ErrorResponse:
     try:
-        runtime_model: RuntimeModel = model_to_runtime_model(model)
+        method: SolverMethod = parse_enum(
+            SolverMethod, parameters.get("method", SolverMethod.LSODA), "solver method"
+        )
 
-        validate_model(runtime_model, parameters["selectedConstants"])
+        if "multiStart" in parameters:
+            parse_enum(
+                SamplingMethod,
+                parameters["multiStart"]["sampling"],
+                "sampling method",
+            )
 
-        data_end_time: float = max(
-            max(values["times"]) for values in parameters["data"].values()
-        )
-        times: npt.NDArray[np.float64] = np.linspace(
-            0,
-            data_end_time + parameters["forecastTime"],
-            parameters["nodesAmount"] + 1,
-            dtype=np.float64,
-        )
-        variables_datatable: Datatable = Datatable()
+        cached_model: ModelCacheEntry = get_cached_model(model)
+        runtime_model: RuntimeModel = cached_model["runtime_model"]
+        compiled_model: CompiledModel = cached_model["compiled_model"]
 
-        variables_datatable.set_constants(
-            {
-                constant["name"]: Values(
-                    times,
-                    np.repeat(
-                        (
-                            parameters["selectedConstants"][constant["name"]]["value"]
-                            if constant["name"] in parameters["selectedConstants"]
-                            else constant["value"]
-                        ),
-                        times.size,
-                    ),
-                    InterpolationType.PIECEWISE_CONSTANT,
-                )
-                for constant in runtime_model["constants"]
-            }
+        validate_parameters(parameters, cached_model)
+
+        times: npt.NDArray[np.float64] = get_times(parameters)
+        sensitivity_model: CompiledModel = get_cached_sensitivity_model(
+            cached_model, list(parameters["selectedConstants"])
         )
-        variables_datatable.set_interventions(
-            {
-                intervention["name"]: Values(
+        local_optima = (
+            sorted(local_optima, key=lambda local_optimum: local_optimum["objective"])
+            if local_optima is not None
+            else (
+                identify_multi_start(
+                    parameters,
+                    runtime_model,
+                    sensitivity_model,
                     times,
-                    np.zeros(times.size),
-                    InterpolationType.PIECEWISE_CONSTANT,
+                    method,
+                    progress,
                 )
-                for intervention in runtime_model["interventions"]
-            }
+                if "multiStart" in parameters
+                else [
+                    identify(
+                        parameters,
+                        runtime_model,
+                        sensitivity_model,
+                        times,
+                        method,
+                        {
+                            name: constant["value"]
+                            for name, constant in parameters[
+                                "selectedConstants"
+                            ].items()
+                        },
+                        progress,
+                    )
+                ]
+            )
+        )
+        variables_datatable: Datatable = get_variables_datatable(
+            runtime_model, times, local_optima[0]["constants"]
         )
 
-        minimize_result = minimize(
-            optimization_criteria,
-            [
-                constant["value"]
-                for constant in parameters["selectedConstants"].values()
-            ],
-            args=(parameters, model, variables_datatable),
-            bounds=[
-                (constant["lowerBoundary"], constant["upperBoundary"])
-                for constant in parameters["selectedConstants"].values()
-            ],
-            method="L-BFGS-B",
+        simulate(
+            runtime_model,
+            compiled_model,
+            times,
+            variables_datatable,
+            method,
+            parameters.get("solver"),
         )
 
-        simulate(runtime_model, times, variables_datatable)
+        result: PIResult = {
+            "approximation": variables_datatable.compartments.resample(times).get_data(
+                parameters.get("maxPoints")
+            ),
+            "constants": local_optima[0]["constants"],
+        }
+
+        if "multiStart" in parameters:
+            result["localOptima"] = local_optima
 
         return {
             "type": "PI",
             "parameters": parameters,
             "model": model,
-            "result": {
-                "approximation": variables_datatable.compartments_data,
-                "constants": {
-                    name: minimize_result.x[i]
-                    for i, name in enumerate(parameters["selectedConstants"])
-                },
-            },
+            "result": result,
         }
 
     except RuntimeError as error:
@@ -112,35 +149,295 @@ def parameters_identification(
         )
 
 
+def validate_parameters(
+    parameters: PIParameters, cached_model: ModelCacheEntry
+) -> None:
+    runtime_model: RuntimeModel = cached_model["runtime_model"]
+
+    validate_cached(
+        cached_model,
+        json.dumps(
+            [
+                "parameters-identification",
+                runtime_model["constants"],
+                parameters["selectedConstants"],
+            ],
+            sort_keys=True,
+        ),
+        lambda: validate_model(runtime_model, parameters["selectedConstants"]),
+    )
+
+
+def prepare_multi_start(
+    parameters: PIParameters, model: Model
+) -> list[dict[str, float]]:
+    parse_enum(
+        SolverMethod, parameters.get("method", SolverMethod.LSODA), "solver method"
+    )
+    validate_parameters(parameters, get_cached_model(model))
+
+    return sample_starts(parameters["selectedConstants"], parameters["multiStart"])
+
+
+def identify_start(
+    parameters: PIParameters,
+    model: Model,
+    start: dict[str, float],
+    progress: ProgressCallback | None = None,
+) -> LocalOptimum:
+    cached_model: ModelCacheEntry = get_cached_model(model)
+
+    if progress is not None:
+        progress(0, MAX_ITERATIONS)
+
+    return identify(
+        parameters,
+        cached_model["runtime_model"],
+        get_cached_sensitivity_model(
+            cached_model, list(parameters["selectedConstants"])
+        ),
+        get_times(parameters),
+        parse_enum(
+            SolverMethod, parameters.get("method", SolverMethod.LSODA), "solver method"
+        ),
+        start,
+        progress,
+    )
+
+
+def get_times(parameters: PIParameters) -> npt.NDArray[np.float64]:
+    data_end_time: float = max(
+        max(values["times"]) for values in parameters["data"].values()
+    )
+
+    return np.linspace(
+        0,
+        data_end_time + parameters["forecastTime"],
+        parameters["nodesAmount"] + 1,
+        dtype=np.float64,
+    )
+
+
+def get_variables_datatable(
+    runtime_model: RuntimeModel,
+    times: npt.NDArray[np.float64],
+    selected_constants: dict[str, float],
+) -> Datatable:
+    variables_datatable: Datatable = Datatable()
+
+    variables_datatable.set_constants(
+        {
+            constant["name"]: selected_constants.get(
+                constant["name"], constant["value"]
+            )
+            for constant in runtime_model["constants"]
+        }
+    )
+    variables_datatable.set_interventions(
+        SeriesTable(
+            times,
+            np.zeros((len(runtime_model["interventions"]), times.size)),
+            [intervention["name"] for intervention in runtime_model["interventions"]],
+            InterpolationType.PIECEWISE_CONSTANT,
+        )
+    )
+
+    return variables_datatable
+
+
+def identify(
+    parameters: PIParameters,
+    runtime_model: RuntimeModel,
+    sensitivity_model: CompiledModel,
+    times: npt.NDArray[np.float64],
+    method: SolverMethod,
+    start: dict[str, float],
+    progress: ProgressCallback | None = None,
+) -> LocalOptimum:
+    variables_datatable: Datatable = get_variables_datatable(
+        runtime_model, times, start
+    )
+    iterations: count[int] = count(1)
+
+    minimize_result = minimize(
+        optimization_criteria,
+        [start[name] for name in parameters["selectedConstants"]],
+        args=(
+            times,
+            parameters,
+            runtime_model,
+            sensitivity_model,
+            variables_datatable,
+            method,
+        ),
+        jac=True,
+        bounds=[
+            (constant["lowerBoundary"], constant["upperBoundary"])
+            for constant in parameters["selectedConstants"].values()
+        ],
+        method="L-BFGS-B",
+        options={"maxiter": MAX_ITERATIONS},
+        callback=(
+            (lambda _: progress(next(iterations), MAX_ITERATIONS))
+            if progress is not None
+            else None
+        ),
+    )
+
+    return {
+        "start": start,
+        "constants": {
+            name: float(minimize_result.x[i])
+            for i, name in enumerate(parameters["selectedConstants"])
+        },
+        "objective": float(minimize_result.fun),
+        "iterations": int(minimize_result.nit),
+        "success": bool(minimize_result.success),
+    }
+
+
+def identify_multi_start(
+    parameters: PIParameters,
+    runtime_model: RuntimeModel,
+    sensitivity_model: CompiledModel,
+    times: npt.NDArray[np.float64],
+    method: SolverMethod,
+    progress: ProgressCallback | None = None,
+) -> list[LocalOptimum]:
+    starts: list[dict[str, float]] = sample_starts(
+        parameters["selectedConstants"], parameters["multiStart"]
+    )
+    local_optima: list[LocalOptimum] = []
+    errors: list[str] = []
+
+    for i, start in enumerate(starts):
+        try:
+            local_optima.append(
+                identify(
+                    parameters,
+                    runtime_model,
+                    sensitivity_model,
+                    times,
+                    method,
+                    start,
+                    (
+                        partial(report_start_progress, progress, i, len(starts))
+                        if progress is not None
+                        else None
+                    ),
+                )
+            )
+
+        except RuntimeError as error:
+            errors.append(str(error))
+
+        if progress is not None:
+            progress((i + 1) * MAX_ITERATIONS, len(starts) * MAX_ITERATIONS)
+
+    if not len(local_optima):
+        raise RuntimeError(errors[0] if len(errors) else "No starting points")
+
+    return sorted(local_optima, key=lambda local_optimum: local_optimum["objective"])
+
+
+def report_start_progress(
+    progress: ProgressCallback,
+    start: int,
+    starts_amount: int,
+    iteration: int,
+    max_iterations: int,
+) -> None:
+    progress(
+        start * max_iterations + min(iteration, max_iterations),
+        starts_amount * max_iterations,
+    )
+
+
+def sample_starts(
+    selected_constants: dict[str, SelectedConstant],
+    multi_start_parameters: MultiStartParameters,
+) -> list[dict[str, float]]:
+    names: list[str] = list(selected_constants)
+    sampler: qmc.QMCEngine = (
+        qmc.Sobol(len(names), seed=multi_start_parameters.get("seed"))
+        if parse_enum(
+            SamplingMethod, multi_start_parameters["sampling"], "sampling method"
+        )
+        is SamplingMethod.SOBOL
+        else qmc.LatinHypercube(len(names), seed=multi_start_parameters.get("seed"))
+    )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+
+        samples: npt.NDArray[np.float64] = sampler.random(
+            max(multi_start_parameters["startsAmount"] - 1, 0)
+        )
+
+    lower_boundaries: npt.NDArray[np.float64] = np.array(
+        [constant["lowerBoundary"] for constant in selected_constants.values()],
+        dtype=np.float64,
+    )
+    upper_boundaries: npt.NDArray[np.float64] = np.array(
+        [constant["upperBoundary"] for constant in selected_constants.values()],
+        dtype=np.float64,
+    )
+
+    return [
+        {name: constant["value"] for name, constant in selected_constants.items()},
+        *[
+            {
+                name: float(value)
+                for name, value in zip(
+                    names,
+                    lower_boundaries + sample * (upper_boundaries - lower_boundaries),
+                )
+            }
+            for sample in samples
+        ],
+    ]
+
+
 def optimization_criteria(
     constants: list[float],
     times: npt.NDArray[np.float64],
     parameters: PIParameters,
     model: RuntimeModel,
+    sensitivity_model: CompiledModel,
     variables_datatable: Datatable,
-) -> float:
+    method: SolverMethod,
+) -> tuple[float, npt.NDArray[np.float64]]:
     variables_datatable.update_constants(
         {
-            constant: Values(
-                times,
-                np.repeat(constants[i], times.size),
-                InterpolationType.PIECEWISE_CONSTANT,
-            )
+            constant: constants[i]
             for i, constant in enumerate(parameters["selectedConstants"])
         }
     )
 
-    simulate(model, times, variables_datatable)
+    sensitivities: SeriesTable = simulate_sensitivities(
+        model,
+        sensitivity_model,
+        list(parameters["selectedConstants"]),
+        times,
+        variables_datatable,
+        method,
+        parameters.get("solver"),
+    )
 
     return calculate_objective(
         parameters["data"],
         variables_datatable.compartments,
+    ), calculate_objective_gradient(
+        parameters["data"],
+        variables_datatable.compartments,
+        sensitivities,
+        list(parameters["selectedConstants"]),
     )
 
 
 def calculate_objective(
     data: dict[str, Data],
-    simulated_data: dict[str, Values],
+    simulated_data: SeriesTable,
 ) -> float:
     cost: float = 0
 
@@ -155,6 +452,35 @@ def calculate_objective(
     return cost
 
 
+def calculate_objective_gradient(
+    data: dict[str, Data],
+    simulated_data: SeriesTable,
+    sensitivities: SeriesTable,
+    constants: list[str],
+) -> npt.NDArray[np.float64]:
+    gradient: npt.NDArray[np.float64] = np.zeros(len(constants), dtype=np.float64)
+
+    for name, known_data in data.items():
+        residuals: npt.NDArray[np.float64] = known_data["values"] - simulated_data[
+            name
+        ](known_data["times"])
+
+        gradient -= 2 * np.array(
+            [
+                np.sum(
+                    residuals
+                    * sensitivities[get_sensitivity_name(name, constant)](
+                        known_data["times"]
+                    )
+                )
+                for constant in constants
+            ],
+            dtype=np.float64,
+        )
+
+    return gradient
+
+
 def validate_model(
     runtime_model: RuntimeModel,
     selected_constants: dict[str, SelectedConstant],
@@ -190,7 +516,7 @@ def validate_model(
         if not all(
             [
                 continuity_type == ContinuityType.CONTINUOUS
-                for continuity_type in continuity_status.items()
+                for continuity_type in continuity_status.values()
             ]
         ):
             discontinuous_variables: list[str] = [
@@ -1,18 +1,23 @@
+import json
 import numpy as np
 import numpy.typing as npt
 import sympy as sp
 
 from classes.common.interpolation_type import InterpolationType
 from classes.common.error_response import ErrorResponse
-from classes.common.values import Values
+from classes.common.series_table import SeriesTable
+from classes.common.solver_method import SolverMethod
+from classes.model.compiled_model import CompiledModel
 from classes.model.continuity_type import ContinuityType
 from classes.model.datatable import Datatable
 from classes.model.model import Model
+from classes.model.model_cache_entry import ModelCacheEntry
 from classes.model.runtime_model import RuntimeModel
 from classes.simulation.parameters import SimulationParameters
 from classes.simulation.success_response import SimulationSuccessResponse
 from functions.is_population_preserved import is_population_preserved
-from functions.model_to_runtime_model import model_to_runtime_model
+from functions.model_cache import get_cached_model, validate_cached
+from functions.parse_enum import parse_enum
 from functions.simulate import simulate
 
 
@@ -20,9 +25,18 @@ def simulation(
     parameters: SimulationParameters, model: Model
 ) -> SimulationSuccessResponse | ErrorResponse:
     try:
-        runtime_model: RuntimeModel = model_to_runtime_model(model)
-
-        validate_model(runtime_model)
+        method: SolverMethod = parse_enum(
+            SolverMethod, parameters.get("method", SolverMethod.LSODA), "solver method"
+        )
+        cached_model: ModelCacheEntry = get_cached_model(model)
+        runtime_model: RuntimeModel = cached_model["runtime_model"]
+        compiled_model: CompiledModel = cached_model["compiled_model"]
+
+        validate_cached(
+            cached_model,
+            json.dumps(["simulation", runtime_model["constants"]], sort_keys=True),
+            lambda: validate_model(runtime_model),
+        )
 
         times: npt.NDArray[np.float64] = np.linspace(
             0,
@@ -30,37 +44,25 @@ def simulation(
             parameters["nodesAmount"] + 1,
             dtype=np.float64,
         )
-        variables_datatable: Datatable = Datatable()
-
-        variables_datatable.set_constants(
-            {
-                constant["name"]: Values(
-                    times,
-                    np.repeat(constant["value"], times.size),
-                    InterpolationType.PIECEWISE_CONSTANT,
-                )
-                for constant in runtime_model["constants"]
-            }
+        variables_datatable: Datatable = get_variables_datatable(runtime_model, times)
+
+        simulate(
+            runtime_model,
+            compiled_model,
+            times,
+            variables_datatable,
+            method,
+            parameters.get("solver"),
         )
-        variables_datatable.set_interventions(
-            {
-                intervention["name"]: Values(
-                    times,
-                    np.zeros(times.size),
-                    InterpolationType.PIECEWISE_CONSTANT,
-                )
-                for intervention in runtime_model["interventions"]
-            }
-        )
-
-        simulate(runtime_model, times, variables_datatable)
 
         return {
             "type": "Simulation",
             "parameters": parameters,
             "model": model,
             "result": {
-                "compartments": variables_datatable.compartments_data,
+                "compartments": variables_datatable.compartments.resample(
+                    times
+                ).get_data(parameters.get("maxPoints")),
             },
         }
 
@@ -81,6 +83,26 @@ def simulation(
         )
 
 
+def get_variables_datatable(
+    runtime_model: RuntimeModel, times: npt.NDArray[np.float64]
+) -> Datatable:
+    variables_datatable: Datatable = Datatable()
+
+    variables_datatable.set_constants(
+        {constant["name"]: constant["value"] for constant in runtime_model["constants"]}
+    )
+    variables_datatable.set_interventions(
+        SeriesTable(
+            times,
+            np.zeros((len(runtime_model["interventions"]), times.size)),
+            [intervention["name"] for intervention in runtime_model["interventions"]],
+            InterpolationType.PIECEWISE_CONSTANT,
+        )
+    )
+
+    return variables_datatable
+
+
 def validate_model(runtime_model: RuntimeModel) -> None:
     for compartment in runtime_model["compartments"].values():
         continuity_status: dict[str, ContinuityType] = {
@@ -0,0 +1,15 @@
+from classes.validate_expression.batch_validation_response import (
+    BatchValidationResponse,
+)
+from middleware.validate_expression import validate_expression
+
+
+def validate_expressions(
+    expressions: dict[str, str], allowed_symbols: list[str]
+) -> BatchValidationResponse:
+    return {
+        "results": {
+            key: validate_expression(expression, allowed_symbols)
+            for key, expression in expressions.items()
+        }
+    }
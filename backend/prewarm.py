@@ -0,0 +1,51 @@
+import argparse
+import json
+import time
+from typing import Any
+
+from classes.model.model import Model
+from functions.code_cache import CODE_CACHE_DIRECTORY
+from functions.model_cache import get_cached_model
+
+
+def get_models(data: Any) -> list[Model]:
+    if isinstance(data, list):
+        return [model for item in data for model in get_models(item)]
+
+    if isinstance(data, dict) and "model" in data:
+        return get_models(data["model"])
+
+    if isinstance(data, dict) and "compartments" in data:
+        return [data]
+
+    raise RuntimeError("File does not contain a model")
+
+
+def prewarm(paths: list[str]) -> None:
+    for path in paths:
+        with open(path, encoding="utf-8") as file:
+            models: list[Model] = get_models(json.load(file))
+
+        for model in models:
+            start: float = time.perf_counter()
+
+            get_cached_model(model)
+
+            print(
+                f"{path}: {len(model["compartments"])} compartments, "
+                f"{len(model["flows"])} flows in {time.perf_counter() - start:.3f} s"
+            )
+
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description=f"Compile saved models into the code cache at {CODE_CACHE_DIRECTORY}"
+    )
+
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="JSON files with a model, a request body or a list of them",
+    )
+
+    prewarm(parser.parse_args().paths)